@@ -80,7 +80,7 @@ class MessageClassifier:
 
         try:
             # Use LLM classification if available
-            if self.nlp.llm_enabled and self.nlp.llm_nlp:
+            if self.nlp.llm_enabled and self.nlp.llm_client:
                 return self._classify_with_llm(text)
 
             # Fall back to rule-based classification
@@ -1,19 +1,115 @@
 """NLP processor using spaCy with LLM integration for message analysis."""
 
 import os
+import re
+import json
 import logging
-from typing import Dict, List, Any
+import functools
+import multiprocessing
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
+import numpy as np
+import orjson
 import spacy
+from spacy.attrs import IS_ALPHA, IS_PUNCT, IS_STOP
 from spacy.tokens import Doc
-
-# For LLM integration
-try:
-    from spacy_llm.util import assemble
-except ImportError:
-    logging.warning("spacy_llm not found, LLM functionality will be limited")
+from openai import OpenAI
 
 logger = logging.getLogger(__name__)
 
+# Number of distinct texts whose analyze_text results are kept in memory
+_ANALYZE_CACHE_SIZE = 4096
+
+# Tiny sentiment lexicon used by _get_sentiment
+_POSITIVE_WORDS = frozenset({"good", "great", "excellent", "happy", "interested"})
+_NEGATIVE_WORDS = frozenset({"bad", "poor", "unhappy", "disappointed"})
+_SENTIMENT_POS = frozenset({"ADJ", "VERB", "ADV"})
+
+# Pipeline components needed for named entity recognition
+_NER_PIPES = frozenset({"tok2vec", "ner"})
+
+# Labels the LLM chooses between when classifying a message
+_LLM_LABELS: Tuple[str, ...] = (
+    "interview_request",
+    "follow_up",
+    "job_offer",
+    "networking",
+    "other",
+)
+
+# Built once so every classification request reuses the same prompt
+_LLM_SYSTEM_PROMPT = (
+    "Classify the user's message into one of these labels: "
+    + ", ".join(_LLM_LABELS)
+    + ". Respond with a JSON object that maps every label to a probability between 0 and 1."
+)
+
+# Substring patterns for rule-based intent classification
+_INTENT_PATTERNS: Dict[str, Tuple[str, ...]] = {
+    "interview_request": (
+        "interview",
+        "schedule",
+        "meet",
+        "meeting",
+        "call",
+        "chat",
+        "availability",
+        "available",
+        "discuss",
+    ),
+    "follow_up": (
+        "follow up",
+        "following up",
+        "checking in",
+        "status",
+        "update",
+    ),
+    "job_offer": ("offer", "pleased to", "happy to", "position", "job", "role"),
+}
+
+_INTENT_BY_PATTERN: Dict[str, str] = {
+    pattern: intent for intent, patterns in _INTENT_PATTERNS.items() for pattern in patterns
+}
+
+# Every pattern that occurs inside another one (e.g. "meet" inside "meeting")
+_INTENT_SUBPATTERNS: Dict[str, Tuple[str, ...]] = {
+    outer: tuple(inner for inner in _INTENT_BY_PATTERN if inner in outer) for outer in _INTENT_BY_PATTERN
+}
+
+# Longest patterns first so the alternation prefers them at a given position
+_INTENT_RE = re.compile(
+    "(?=(" + "|".join(re.escape(p) for p in sorted(_INTENT_BY_PATTERN, key=len, reverse=True)) + "))"
+)
+
+
+@dataclass(frozen=True)
+class _TextFeatures:
+    """Immutable spaCy-derived part of an analyze_text result, safe to share from the cache."""
+
+    __slots__ = ("entities", "keywords", "sentiment", "subject")
+
+    entities: Tuple[Tuple[str, str, int, int], ...]  # (text, label, start, end)
+    keywords: Tuple[str, ...]
+    sentiment: Tuple[Tuple[str, float], ...]  # (name, score)
+    subject: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the features to a new analysis result dictionary.
+
+        Returns:
+            Dictionary with entities, keywords, sentiment and subject
+        """
+        return {
+            "entities": [
+                {"text": text, "label": label, "start": start, "end": end}
+                for text, label, start, end in self.entities
+            ],
+            "keywords": list(self.keywords),
+            "sentiment": dict(self.sentiment),
+            "subject": self.subject,
+        }
+
 
 class NLPProcessor:
     """Processor for NLP tasks using spaCy with LLM integration."""
@@ -28,57 +124,35 @@ class NLPProcessor:
             self.llm_enabled = os.getenv("ENABLE_LLM", "true").lower() == "true"
 
             if self.llm_enabled:
-                self._init_llm_pipeline()
+                self._init_llm_client()
                 logger.info("NLP processor initialized with LLM integration")
             else:
-                self.llm_nlp = None
+                self.llm_client = None
                 logger.info("NLP processor initialized with basic spaCy (LLM disabled)")
 
             self.client = None  # Initialize the attribute
 
+            # Duplicate messages ("Thanks!", "Following up") skip the pipeline entirely
+            self._analyze_text_cached = functools.lru_cache(maxsize=_ANALYZE_CACHE_SIZE)(
+                self._analyze_text_uncached
+            )
+
         except Exception as e:
             logger.error(f"Error initializing NLP processor: {str(e)}", exc_info=True)
             self.basic_nlp = None
-            self.llm_nlp = None
+            self.llm_client = None
 
-    def _init_llm_pipeline(self) -> None:
-        """Initialize spaCy pipeline with LLM integration."""
+    def _init_llm_client(self) -> None:
+        """Initialize the OpenAI client used for LLM classification."""
         try:
-            # Set OpenAI API key for spaCy LLM
-            os.environ["OPENAI_API_KEY"] = os.getenv("OPENAI_API_KEY", "")
-
-            # Configure LLM pipeline
-            llm_model = os.getenv("SPACY_LLM_MODEL", "gpt-3.5-turbo")
-
-            # Define a custom pipeline with text classification component
-            config = {
-                "nlp": {"lang": "en", "pipeline": ["llm"]},
-                "components": {
-                    "llm": {
-                        "factory": "llm",
-                        "model": llm_model,
-                        "config": {
-                            "task": {
-                                "@llm_tasks": "spacy.TextCat.v2",
-                                "labels": [
-                                    "interview_request",
-                                    "follow_up",
-                                    "job_offer",
-                                    "networking",
-                                    "other",
-                                ],
-                            }
-                        },
-                    }
-                },
-            }
-
-            # Assemble the pipeline from config
-            self.llm_nlp = assemble(config)
+            self.llm_model = os.getenv("SPACY_LLM_MODEL", "gpt-3.5-turbo")
+
+            # Call OpenAI directly rather than through a spaCy pipeline wrapper
+            self.llm_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY", ""))
 
         except Exception as e:
-            logger.error(f"Error initializing LLM pipeline: {str(e)}", exc_info=True)
-            self.llm_nlp = None
+            logger.error(f"Error initializing LLM client: {str(e)}", exc_info=True)
+            self.llm_client = None
 
     def analyze_text(self, text: str) -> Dict[str, Any]:
         """
@@ -95,41 +169,140 @@ class NLPProcessor:
             return {"error": "NLP processor not initialized"}
 
         try:
-            # Process with basic spaCy
-            doc = self.basic_nlp(text)
-
-            # Extract basic entities and keywords
-            entities = [
-                {
-                    "text": ent.text,
-                    "label": ent.label_,
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                }
-                for ent in doc.ents
-            ]
-
-            keywords = [
-                token.text for token in doc if not token.is_stop and not token.is_punct and token.is_alpha
-            ]
-
-            result = {
-                "entities": entities,
-                "keywords": keywords[:10],  # Top 10 keywords
-                "sentiment": self._get_sentiment(doc),
-                "subject": self._extract_subject(doc),
-            }
-
-            # Add LLM classification if available
-            if self.llm_enabled and self.llm_nlp:
-                result["llm_classification"] = self._classify_with_llm(text)
-
-            return result
+            # Only the spaCy features are cached; each call gets its own result dictionary
+            result = self._analyze_text_cached(text).to_dict()
 
         except Exception as e:
             logger.error(f"Error analyzing text: {str(e)}", exc_info=True)
             return {"error": str(e)}
 
+        self._add_llm_classification(result, text)
+        return result
+
+    def analyze_text_json(self, text: str) -> bytes:
+        """
+        Analyze text and serialize the result to JSON.
+
+        Args:
+            text: The text to analyze
+
+        Returns:
+            UTF-8 encoded JSON of the analyze_text result
+        """
+        return orjson.dumps(self.analyze_text(text))
+
+    def _analyze_text_uncached(self, text: str) -> _TextFeatures:
+        """
+        Run the spaCy pipeline on text without consulting the cache.
+
+        Args:
+            text: The text to analyze
+
+        Returns:
+            The spaCy-derived features of the text
+
+        Raises:
+            Exception: Pipeline errors propagate so that failures are never cached
+        """
+        # Process with basic spaCy
+        return self._doc_features(self.basic_nlp(text))
+
+    def analyze_texts(self, texts: List[str], batch_size: int = 64) -> List[Dict[str, Any]]:
+        """
+        Analyze many texts, streaming them through spaCy in batches.
+
+        Args:
+            texts: The texts to analyze
+            batch_size: Number of texts spaCy processes per batch
+
+        Returns:
+            List of analysis result dictionaries, in the same order as texts
+        """
+        if not self.basic_nlp:
+            logger.error("NLP processor not initialized")
+            return [{"error": "NLP processor not initialized"} for _ in texts]
+
+        try:
+            n_process = self._pick_n_process(len(texts), batch_size)
+            docs = self.basic_nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+            return [self._analyze_doc(doc, text) for doc, text in zip(docs, texts)]
+
+        except Exception as e:
+            logger.error(f"Error analyzing texts: {str(e)}", exc_info=True)
+            return [{"error": str(e)} for _ in texts]
+
+    def _pick_n_process(self, n_texts: int, batch_size: int) -> int:
+        """
+        Choose how many worker processes spaCy should use for a batch.
+
+        Pickling Docs between processes costs more than it saves on small
+        workloads, so stay single-process unless there are several batches
+        of work for each extra core.
+
+        Args:
+            n_texts: Number of texts to process
+            batch_size: Number of texts per batch
+
+        Returns:
+            Number of processes to pass to nlp.pipe
+        """
+        if n_texts < 4 * batch_size:
+            return 1
+
+        return max(1, min(multiprocessing.cpu_count() - 1, n_texts // batch_size))
+
+    def _analyze_doc(self, doc: Doc, text: str) -> Dict[str, Any]:
+        """
+        Build the analyze_text result for an already processed document.
+
+        Args:
+            doc: spaCy document
+            text: The text the document was built from
+
+        Returns:
+            Dictionary with analysis results
+        """
+        result = self._doc_features(doc).to_dict()
+        self._add_llm_classification(result, text)
+        return result
+
+    def _doc_features(self, doc: Doc) -> _TextFeatures:
+        """
+        Extract the spaCy-derived features of a processed document.
+
+        Args:
+            doc: spaCy document
+
+        Returns:
+            Entities, keywords, sentiment and subject of the document
+        """
+        # Extract basic entities and keywords
+        entities = tuple((ent.text, ent.label_, ent.start_char, ent.end_char) for ent in doc.ents)
+
+        # Top 10 keywords, filtered on a vectorized attribute matrix instead of
+        # reading three Python attributes per token
+        flags = doc.to_array([IS_ALPHA, IS_STOP, IS_PUNCT])
+        mask = (flags[:, 0] == 1) & (flags[:, 1] == 0) & (flags[:, 2] == 0)
+        keywords = tuple(doc[int(i)].text for i in np.flatnonzero(mask)[:10])
+
+        return _TextFeatures(
+            entities=entities,
+            keywords=keywords,
+            sentiment=tuple(self._get_sentiment(doc).items()),
+            subject=self._extract_subject(doc),
+        )
+
+    def _add_llm_classification(self, result: Dict[str, Any], text: str) -> None:
+        """
+        Add LLM classification scores to an analysis result if the LLM is enabled.
+
+        Args:
+            result: Analysis result dictionary, updated in place
+            text: The text the result was built from
+        """
+        if self.llm_enabled and self.llm_client:
+            result["llm_classification"] = self._classify_with_llm(text)
+
     def _get_sentiment(self, doc: Doc) -> Dict[str, float]:
         """
         Get sentiment scores from spaCy document.
@@ -145,18 +318,14 @@ class NLPProcessor:
         negative_words = 0
 
         for token in doc:
-            if token.pos_ in ["ADJ", "VERB", "ADV"]:
+            if token.pos_ in _SENTIMENT_POS:
                 # This is a simple approach - a real implementation would use
                 # a more sophisticated sentiment lexicon
-                if token.text.lower() in [
-                    "good",
-                    "great",
-                    "excellent",
-                    "happy",
-                    "interested",
-                ]:
+                # spaCy caches the lower-cased form, so avoid calling str.lower() per token
+                word = token.lower_
+                if word in _POSITIVE_WORDS:
                     positive_words += 1
-                elif token.text.lower() in ["bad", "poor", "unhappy", "disappointed"]:
+                elif word in _NEGATIVE_WORDS:
                     negative_words += 1
 
         total = max(1, positive_words + negative_words)
@@ -179,10 +348,12 @@ class NLPProcessor:
         Returns:
             Extracted subject or empty string
         """
-        # Simple subject extraction - find the first noun chunk
-        for chunk in doc.noun_chunks:
-            if chunk.root.dep_ in ["nsubj", "nsubjpass"]:
-                return chunk.text
+        # Simple subject extraction - find the first nominal subject token and
+        # rebuild its noun chunk (left edge up to the head noun) directly, so we
+        # stop at the first match instead of materializing every noun chunk
+        for token in doc:
+            if token.dep_ in ("nsubj", "nsubjpass") and token.pos_ in ("NOUN", "PROPN", "PRON"):
+                return doc[token.left_edge.i : token.i + 1].text
 
         # Fallback to first noun chunk
         for chunk in doc.noun_chunks:
@@ -201,17 +372,23 @@ class NLPProcessor:
             Dictionary with classification scores
         """
         try:
-            # Check if llm_nlp is None before calling it
-            if self.llm_nlp is None:
-                logger.warning("LLM NLP model not initialized")
+            # Check if llm_client is None before calling it
+            if self.llm_client is None:
+                logger.warning("LLM client not initialized")
                 return {}
 
-            doc = self.llm_nlp(text)
-
-            # Extract classification scores
-            cats = doc.cats
+            response = self.llm_client.chat.completions.create(
+                model=self.llm_model,
+                response_format={"type": "json_object"},
+                messages=[
+                    {"role": "system", "content": _LLM_SYSTEM_PROMPT},
+                    {"role": "user", "content": text},
+                ],
+            )
+            scores = json.loads(response.choices[0].message.content or "{}")
 
-            return cats
+            # Extract classification scores, ignoring any label we didn't ask for
+            return {label: float(scores[label]) for label in _LLM_LABELS if label in scores}
 
         except Exception as e:
             logger.error(f"Error classifying with LLM: {str(e)}", exc_info=True)
@@ -228,21 +405,37 @@ class NLPProcessor:
             Dictionary of entity types and their values
         """
         try:
-            doc = self.basic_nlp(text)
-            entities: Dict[str, Any] = {}
-
-            for ent in doc.ents:
-                if ent.label_ not in entities:
-                    entities[ent.label_] = []
+            # Only the NER component is needed; skip tagger, parser and lemmatizer
+            enabled = [name for name in self.basic_nlp.pipe_names if name in _NER_PIPES]
+            with self.basic_nlp.select_pipes(enable=enabled):
+                doc = self.basic_nlp(text)
 
-                entities[ent.label_].append(ent.text)
-
-            return entities
+            return self._entities_from_doc(doc)
 
         except Exception as e:
             logger.error(f"Error extracting entities: {str(e)}", exc_info=True)
             return {}
 
+    def _entities_from_doc(self, doc: Doc) -> Dict[str, List[str]]:
+        """
+        Group the named entities of an already processed document by label.
+
+        Args:
+            doc: spaCy document
+
+        Returns:
+            Dictionary of entity types and their values
+        """
+        entities: Dict[str, Any] = {}
+
+        for ent in doc.ents:
+            if ent.label_ not in entities:
+                entities[ent.label_] = []
+
+            entities[ent.label_].append(ent.text)
+
+        return entities
+
     def analyze_sentiment(self, text: str) -> Dict[str, float]:
         """
         Analyze sentiment of text.
@@ -255,22 +448,33 @@ class NLPProcessor:
         """
         try:
             doc = self.basic_nlp(text)
-
-            # Note: Basic spaCy models don't include sentiment
-            # This requires the TextBlob extension or custom logic
-            # For this example, we'll assume the doc has a polarity score
-            polarity = getattr(doc._, "polarity", 0.0)
-
-            return {
-                "polarity": polarity,
-                "is_positive": polarity > 0.1,
-                "is_negative": polarity < -0.1,
-            }
+            return self._sentiment_from_doc(doc)
 
         except Exception as e:
             logger.error(f"Error analyzing sentiment: {str(e)}", exc_info=True)
             return {"polarity": 0.0, "is_positive": False, "is_negative": False}
 
+    def _sentiment_from_doc(self, doc: Doc) -> Dict[str, Any]:
+        """
+        Derive sentiment metrics from an already processed document.
+
+        Args:
+            doc: spaCy document
+
+        Returns:
+            Dictionary with sentiment metrics
+        """
+        # Note: Basic spaCy models don't include sentiment
+        # This requires the TextBlob extension or custom logic
+        # For this example, we'll assume the doc has a polarity score
+        polarity = getattr(doc._, "polarity", 0.0)
+
+        return {
+            "polarity": polarity,
+            "is_positive": polarity > 0.1,
+            "is_negative": polarity < -0.1,
+        }
+
     def analyze_message(self, text: str) -> Dict[str, Any]:
         """
         Perform comprehensive analysis on a message.
@@ -281,9 +485,22 @@ class NLPProcessor:
         Returns:
             Dictionary with analysis results
         """
+        # Run the spaCy pipeline once and derive every doc-level feature from it
+        try:
+            doc = self.basic_nlp(text)
+            entities = self._entities_from_doc(doc)
+            sentiment = self._sentiment_from_doc(doc)
+            subject = self._extract_subject(doc)
+        except Exception as e:
+            logger.error(f"Error analyzing message: {str(e)}", exc_info=True)
+            entities = {}
+            sentiment = {"polarity": 0.0, "is_positive": False, "is_negative": False}
+            subject = ""
+
         results = {
-            "entities": self.extract_entities(text),
-            "sentiment": self.analyze_sentiment(text),
+            "entities": entities,
+            "sentiment": sentiment,
+            "subject": subject,
             "intent": "unknown",
             "confidence": 0.0,
         }
@@ -302,35 +519,20 @@ class NLPProcessor:
         """Classify intent, based on rules."""
         text_lower = text.lower()
 
-        # Interview request patterns
-        interview_patterns = [
-            "interview",
-            "schedule",
-            "meet",
-            "meeting",
-            "call",
-            "chat",
-            "availability",
-            "available",
-            "discuss",
-        ]
-
-        # Follow-up patterns
-        follow_up_patterns = [
-            "follow up",
-            "following up",
-            "checking in",
-            "status",
-            "update",
-        ]
-
-        # Job offer patterns
-        offer_patterns = ["offer", "pleased to", "happy to", "position", "job", "role"]
+        # Single C-level scan; the zero-width lookahead reports the longest pattern
+        # starting at every position, so overlapping patterns are still seen
+        matched = set()
+        for match in _INTENT_RE.finditer(text_lower):
+            matched.update(_INTENT_SUBPATTERNS[match.group(1)])
 
         # Count matches for each intent
-        interview_matches = sum(1 for p in interview_patterns if p in text_lower)
-        follow_up_matches = sum(1 for p in follow_up_patterns if p in text_lower)
-        offer_matches = sum(1 for p in offer_patterns if p in text_lower)
+        counts = {intent: 0 for intent in _INTENT_PATTERNS}
+        for pattern in matched:
+            counts[_INTENT_BY_PATTERN[pattern]] += 1
+
+        interview_matches = counts["interview_request"]
+        follow_up_matches = counts["follow_up"]
+        offer_matches = counts["job_offer"]
 
         # Determine the most likely intent
         max_matches = max(interview_matches, follow_up_matches, offer_matches)
@@ -4,10 +4,85 @@ import os
 import logging
 import requests
 import datetime
-from typing import Dict, Any, Optional, List
+import orjson
+from dataclasses import dataclass
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, Optional, List, Hashable, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Maximum page size accepted by the Calendly API
+_PAGE_SIZE = 100
+
+# Seconds before cached responses are revalidated with Calendly
+_EVENT_TYPES_TTL = 3600
+_EVENTS_TTL = 120
+
+
+def _iso_z(dt: datetime.datetime) -> str:
+    """
+    Format a datetime as a UTC ISO 8601 timestamp with a "Z" suffix.
+
+    Naive datetimes are assumed to already be in UTC; aware ones are converted.
+
+    Args:
+        dt: Datetime to format
+
+    Returns:
+        Timestamp string to the second, e.g. "2023-01-15T09:00:00Z"
+    """
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+
+    return f"{dt.isoformat(timespec='seconds')}Z"
+
+
+@dataclass(frozen=True)
+class ScheduledEvent:
+    """A scheduled Calendly event, flattened from the API response."""
+
+    # Declared by hand rather than with slots=True, which needs Python 3.10
+    __slots__ = (
+        "id",
+        "name",
+        "start_time",
+        "end_time",
+        "status",
+        "event_type",
+        "location",
+        "cancellation_url",
+    )
+
+    id: str
+    name: str
+    start_time: str
+    end_time: str
+    status: str
+    event_type: str
+    location: str
+    cancellation_url: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convert the event to a dictionary.
+
+        Returns:
+            Event dictionary with attributes at the top level
+        """
+        return {
+            "id": self.id,
+            "name": self.name,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "status": self.status,
+            "event_type": self.event_type,
+            "location": self.location,
+            "cancellation_url": self.cancellation_url,
+        }
+
 
 class CalendlyScheduler:
     """Scheduler using Calendly API."""
@@ -25,15 +100,42 @@ class CalendlyScheduler:
             "Content-Type": "application/json",
         }
 
+        # Pooled keep-alive session so TLS handshakes are amortized across calls
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Ask for compressed JSON; brotli decoding is handled by urllib3 when brotli is installed
+        self.session.headers["Accept-Encoding"] = "br, gzip"
+        # Throttled or failed reads are retried with exponential backoff, waiting out any
+        # Retry-After the API sends
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            respect_retry_after_header=True,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"GET"}),
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount("https://", adapter)
+
         # Default scheduling links
         self.default_link = "https://calendly.com/fake/interview"
 
         # Cache for event types
         self.event_types: Optional[List[Dict[str, Any]]] = None
 
+        # Fresh responses are served from the TTL caches; once they expire the last
+        # ETag is sent as If-None-Match so an unchanged 304 skips re-parsing
+        self._event_types_cache: TTLCache = TTLCache(maxsize=8, ttl=_EVENT_TYPES_TTL)
+        self._events_cache: TTLCache = TTLCache(maxsize=128, ttl=_EVENTS_TTL)
+        self._etags: LRUCache = LRUCache(maxsize=256)
+
         if not self.api_key:
             logger.warning("Calendly API key not found in environment variables")
 
+    def close(self) -> None:
+        """Close the pooled HTTP session."""
+        self.session.close()
+
     def get_scheduling_link(self, event_type: str = "interview") -> str:
         """
         Get a scheduling link for a specific event type.
@@ -59,31 +161,67 @@ class CalendlyScheduler:
             logger.warning("Calendly API credentials not configured")
             return []
 
-        # Even though we have type annotation on self.event_types, we need to be more explicit
-        if isinstance(self.event_types, list):
-            return self.event_types
+        cached_types = self._event_types_cache.get(self.user)
+        if cached_types is not None:
+            return cached_types
 
         try:
             url = f"{self.base_url}/event_types?user={self.user}"
-            response = requests.get(url, headers=self.headers)
-
-            if response.status_code == 200:
-                data = response.json()
+            etag_key = ("event_types", self.user)
+            validator = self._etags.get(etag_key)
+            response = self.session.get(url, headers=self._conditional_headers(validator))
+
+            if response.status_code == 304 and validator is not None:
+                # Unchanged since the last fetch
+                event_types_data = validator[1]
+            elif response.status_code == 200:
+                data = orjson.loads(response.content)
                 # Extract data and ensure it's a list
                 event_types_data = data.get("data", []) if isinstance(data, dict) else []
-                # Explicitly set to a list, never None
-                self.event_types = event_types_data
-                return self.event_types
+                self._store_etag(etag_key, response, event_types_data)
             else:
                 logger.error(f"Error fetching Calendly event types: {response.status_code}")
                 self.event_types = []  # Explicitly set to empty list on error
                 return []
 
+            # Explicitly set to a list, never None
+            self.event_types = event_types_data
+            self._event_types_cache[self.user] = event_types_data
+            return self.event_types
+
         except Exception as e:
             logger.error(f"Error communicating with Calendly API: {str(e)}", exc_info=True)
             self.event_types = []  # Explicitly set to empty list on error
             return []
 
+    def _conditional_headers(self, validator: Optional[Tuple[str, Any]]) -> Dict[str, str]:
+        """
+        Build request headers that revalidate a previously cached response.
+
+        Args:
+            validator: (ETag, cached value) from an earlier response, if any
+
+        Returns:
+            Headers to send with the request
+        """
+        if validator is None:
+            return {}
+
+        return {"If-None-Match": validator[0]}
+
+    def _store_etag(self, key: Hashable, response: requests.Response, value: Any) -> None:
+        """
+        Remember a response's ETag together with the value parsed from it.
+
+        Args:
+            key: Cache key identifying the request
+            response: The HTTP response
+            value: The value parsed from the response
+        """
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etags[key] = (etag, value)
+
     def get_scheduled_events(
         self,
         start_time: Optional[datetime.datetime] = None,
@@ -105,14 +243,19 @@ class CalendlyScheduler:
 
         # Set default date range if not provided
         if start_time is None:
-            start_time = datetime.datetime.now()
+            start_time = datetime.datetime.now(datetime.timezone.utc)
 
         if end_time is None:
             end_time = start_time + datetime.timedelta(days=30)
 
         # Format dates for Calendly API
-        min_start_time = start_time.isoformat() + "Z"
-        max_start_time = end_time.isoformat() + "Z"
+        min_start_time = _iso_z(start_time)
+        max_start_time = _iso_z(end_time)
+
+        cache_key = (self.user, min_start_time, max_start_time)
+        cached_events = self._events_cache.get(cache_key)
+        if cached_events is not None:
+            return [event.to_dict() for event in cached_events]
 
         try:
             url = f"{self.base_url}/scheduled_events"
@@ -121,42 +264,50 @@ class CalendlyScheduler:
                 "min_start_time": min_start_time,
                 "max_start_time": max_start_time,
                 "status": "active",
+                "count": _PAGE_SIZE,
             }
 
-            response = requests.get(url, headers=self.headers, params=params)
+            validator = self._etags.get(cache_key)
+            response = self.session.get(url, params=params, headers=self._conditional_headers(validator))
+
+            if response.status_code == 304 and validator is not None:
+                # Unchanged since the last fetch
+                self._events_cache[cache_key] = validator[1]
+                return [event.to_dict() for event in validator[1]]
 
             if response.status_code == 200:
-                data = response.json()
-                raw_events = data.get("data", [])
-
-                # Transform events to expected format
-                events = []
-                for event in raw_events:
-                    # Extract event attributes
-                    attrs = event.get("attributes", {})
-                    location_obj = attrs.get("location", {})
-
-                    # Extract location string if available, otherwise use empty string
-                    location_str = (
-                        location_obj.get("location", "")
-                        if isinstance(location_obj, dict)
-                        else str(location_obj)
-                    )
-
-                    # Create flattened event object with attributes at top level
-                    processed_event = {
-                        "id": event.get("id", ""),
-                        "name": attrs.get("name", ""),
-                        "start_time": attrs.get("start_time", ""),
-                        "end_time": attrs.get("end_time", ""),
-                        "status": attrs.get("status", ""),
-                        "event_type": attrs.get("event_type", ""),
-                        "location": location_str,
-                        "cancellation_url": attrs.get("cancellation_url", ""),
-                    }
-                    events.append(processed_event)
-
-                return events
+                first_page = response
+                events: List[ScheduledEvent] = []
+                complete = True
+
+                # Follow pagination so accounts with many events aren't silently truncated.
+                # Each page links to the next, so pages can't be fetched in parallel, but the
+                # next download overlaps with transforming the page already received.
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    while True:
+                        data = orjson.loads(response.content)
+                        next_page = data.get("pagination", {}).get("next_page")
+                        pending = executor.submit(self.session.get, next_page) if next_page else None
+
+                        events.extend(self._transform_event(event) for event in data.get("data", []))
+
+                        if pending is None:
+                            break
+
+                        response = pending.result()
+                        if response.status_code != 200:
+                            logger.error(f"Error fetching Calendly events page: {response.status_code}")
+                            complete = False
+                            break
+
+                # Never cache a partial result. The first page's ETag only covers that page,
+                # so multi-page results are revalidated by refetching once the TTL expires.
+                if complete:
+                    self._events_cache[cache_key] = events
+                    if response is first_page:
+                        self._store_etag(cache_key, first_page, events)
+
+                return [event.to_dict() for event in events]
             else:
                 logger.error(f"Error fetching Calendly events: {response.status_code}")
                 return []
@@ -165,6 +316,36 @@ class CalendlyScheduler:
             logger.error(f"Error fetching scheduled events: {str(e)}", exc_info=True)
             return []
 
+    def _transform_event(self, event: Dict[str, Any]) -> ScheduledEvent:
+        """
+        Flatten a raw Calendly event into the expected format.
+
+        Args:
+            event: Raw event from the Calendly API
+
+        Returns:
+            Scheduled event with attributes at the top level
+        """
+        # Extract event attributes
+        attrs = event.get("attributes", {})
+        location_obj = attrs.get("location", {})
+
+        # Extract location string if available, otherwise use empty string
+        location_str = (
+            location_obj.get("location", "") if isinstance(location_obj, dict) else str(location_obj)
+        )
+
+        return ScheduledEvent(
+            event.get("id", ""),
+            attrs.get("name", ""),
+            attrs.get("start_time", ""),
+            attrs.get("end_time", ""),
+            attrs.get("status", ""),
+            attrs.get("event_type", ""),
+            location_str,
+            attrs.get("cancellation_url", ""),
+        )
+
     def get_available_slots(self) -> List[Dict[str, Any]]:
         """
         Get available time slots for scheduling.
@@ -187,10 +368,10 @@ class CalendlyScheduler:
             #     "start_time": datetime.datetime.now().isoformat(),
             #     "end_time": (datetime.datetime.now() + datetime.timedelta(days=14)).isoformat()
             # }
-            # response = requests.get(url, headers=self.headers, params=params)
+            # response = self.session.get(url, params=params)
             #
             # if response.status_code == 200:
-            #     data = response.json()
+            #     data = orjson.loads(response.content)
             #     return data.get("available_slots", [])
 
             logger.warning("Calendly get_available_slots not fully implemented")
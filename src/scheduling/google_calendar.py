@@ -2,14 +2,102 @@
 
 import os
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
-import pytz
+import functools
+import secrets
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import orjson
+import httplib2
+import google_auth_httplib2
 from googleapiclient.discovery import build
+from googleapiclient.model import JsonModel
 from google.oauth2 import service_account
 
 logger = logging.getLogger(__name__)
 
+# Socket timeout in seconds for Calendar API requests
+_HTTP_TIMEOUT = 10
+
+# Retries, with exponential backoff, for read-only Calendar API calls that are
+# rate limited or fail with a server error
+_NUM_RETRIES = 5
+
+# Maximum number of calls the Calendar API accepts in one batch request
+_MAX_BATCH_SIZE = 50
+
+# Working hours and slot spacing for availability, in seconds after midnight UTC
+_WORKDAY_START = 8 * 3600
+_WORKDAY_END = 18 * 3600
+_SLOT_STEP = 30 * 60
+_SECONDS_PER_DAY = 24 * 3600
+_MICROSECONDS_PER_SECOND = 1_000_000
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> float:
+    """
+    Parse an RFC 3339 timestamp from the Calendar API into epoch seconds.
+
+    Busy periods repeat across availability queries, so parses are memoized.
+
+    Args:
+        value: Timestamp string, e.g. "2023-01-20T09:00:00Z"
+
+    Returns:
+        Seconds since the Unix epoch
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def _merge_intervals(starts: np.ndarray, ends: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge overlapping or touching intervals.
+
+    Args:
+        starts: Interval start times, in any order
+        ends: Interval end times, matching starts
+
+    Returns:
+        Start and end arrays of the merged intervals, sorted and disjoint
+    """
+    if not starts.size:
+        return starts, ends
+
+    order = np.argsort(starts, kind="stable")
+    starts = starts[order]
+    running_ends = np.maximum.accumulate(ends[order])
+
+    # A new interval begins wherever a start falls after everything before it has ended
+    breaks = np.flatnonzero(starts[1:] > running_ends[:-1]) + 1
+    return starts[np.r_[0, breaks]], running_ends[np.r_[breaks - 1, -1]]
+
+
+class OrjsonModel(JsonModel):
+    """JSON model for the Google API client that parses responses with orjson."""
+
+    def deserialize(self, content: Any) -> Any:
+        """
+        Parse a response body.
+
+        Args:
+            content: Raw response body, as bytes or str
+
+        Returns:
+            Parsed JSON body, or the raw content if it isn't valid JSON
+        """
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return content
+
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+
+        return body
+
 
 class GoogleCalendarScheduler:
     """Scheduler using Google Calendar API."""
@@ -29,6 +117,8 @@ class GoogleCalendarScheduler:
         except Exception as e:
             logger.error(f"Error initializing Google Calendar: {str(e)}", exc_info=True)
             self.service = None
+            self._events = None
+            self._freebusy = None
 
     def _init_calendar(self) -> None:
         """Initialize Google Calendar API client."""
@@ -40,12 +130,31 @@ class GoogleCalendarScheduler:
                 self.credentials_path, scopes=scopes
             )
 
-            self.service = build("calendar", "v3", credentials=credentials)
+            # Reuse one authorized keep-alive connection for every call made by the service
+            http = google_auth_httplib2.AuthorizedHttp(
+                credentials, http=httplib2.Http(cache=None, timeout=_HTTP_TIMEOUT)
+            )
+
+            # Load the discovery document bundled with googleapiclient instead of fetching it
+            self.service = build(
+                "calendar",
+                "v3",
+                http=http,
+                static_discovery=True,
+                cache_discovery=False,
+                model=OrjsonModel(),
+            )
+
+            # Bind the resource collections once rather than rebuilding them on every call
+            self._events = self.service.events()
+            self._freebusy = self.service.freebusy()
             logger.info("Google Calendar API initialized successfully")
 
         except Exception as e:
             logger.error(f"Error initializing Google Calendar API: {str(e)}", exc_info=True)
             self.service = None
+            self._events = None
+            self._freebusy = None
 
     def create_event(self, event_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -68,49 +177,16 @@ class GoogleCalendarScheduler:
             return None
 
         try:
-            # Format the event
-            event = {
-                "summary": event_data.get("summary", "Interview"),
-                "description": event_data.get("description", ""),
-                "start": {
-                    "dateTime": event_data.get("start_time"),
-                    "timeZone": event_data.get("timezone", "UTC"),
-                },
-                "end": {
-                    "dateTime": event_data.get("end_time"),
-                    "timeZone": event_data.get("timezone", "UTC"),
-                },
-            }
-
-            # Add attendees if available
-            if "attendees" in event_data and event_data["attendees"]:
-                event["attendees"] = [{"email": email} for email in event_data["attendees"]]
-
-            # Add location if available
-            if "location" in event_data and event_data["location"]:
-                event["location"] = event_data["location"]
-
-            # Add conference details if needed
-            if event_data.get("add_conferencing", True):
-                event["conferenceData"] = {
-                    "createRequest": {
-                        "requestId": f"interview-{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                        "conferenceSolutionKey": {"type": "hangoutsMeet"},
-                    }
-                }
+            event = self._build_event(event_data)
 
             # Create the event
             conf_version = 1 if event_data.get("add_conferencing", True) else 0
-            created_event = (
-                self.service.events()
-                .insert(
-                    calendarId=self.calendar_id,
-                    body=event,
-                    conferenceDataVersion=conf_version,
-                    sendUpdates="all",
-                )
-                .execute()
-            )
+            created_event = self._events.insert(
+                calendarId=self.calendar_id,
+                body=event,
+                conferenceDataVersion=conf_version,
+                sendUpdates="all",
+            ).execute()
 
             logger.info(f"Created Google Calendar event: {created_event['id']}")
             return created_event["id"]
@@ -119,6 +195,98 @@ class GoogleCalendarScheduler:
             logger.error(f"Error creating Google Calendar event: {str(e)}", exc_info=True)
             return None
 
+    def create_events_bulk(self, event_data_list: List[Dict[str, Any]]) -> List[Optional[str]]:
+        """
+        Create several calendar events using batched HTTP requests.
+
+        Args:
+            event_data_list: List of event detail dictionaries, as accepted by create_event
+
+        Returns:
+            Event IDs in the same order as event_data_list, with None for events that failed
+        """
+        if not self.service:
+            logger.error("Google Calendar service not initialized")
+            return [None] * len(event_data_list)
+
+        event_ids: List[Optional[str]] = [None] * len(event_data_list)
+
+        def _store_id(request_id: str, response: Dict[str, Any], exception: Optional[Exception]) -> None:
+            if exception is not None:
+                logger.error(f"Error creating Google Calendar event: {str(exception)}")
+                return
+
+            event_ids[int(request_id)] = response["id"]
+            logger.info(f"Created Google Calendar event: {response['id']}")
+
+        try:
+            # The Calendar API accepts a limited number of calls per batch request
+            for offset in range(0, len(event_data_list), _MAX_BATCH_SIZE):
+                batch = self.service.new_batch_http_request(callback=_store_id)
+
+                for index in range(offset, min(offset + _MAX_BATCH_SIZE, len(event_data_list))):
+                    event_data = event_data_list[index]
+                    conf_version = 1 if event_data.get("add_conferencing", True) else 0
+                    batch.add(
+                        self._events.insert(
+                            calendarId=self.calendar_id,
+                            body=self._build_event(event_data),
+                            conferenceDataVersion=conf_version,
+                            sendUpdates="all",
+                        ),
+                        request_id=str(index),
+                    )
+
+                batch.execute()
+
+        except Exception as e:
+            logger.error(f"Error creating Google Calendar events: {str(e)}", exc_info=True)
+
+        return event_ids
+
+    def _build_event(self, event_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build a Calendar API event resource from event details.
+
+        Args:
+            event_data: Dictionary with event details, as accepted by create_event
+
+        Returns:
+            Event resource body for events().insert
+        """
+        # Format the event
+        event = {
+            "summary": event_data.get("summary", "Interview"),
+            "description": event_data.get("description", ""),
+            "start": {
+                "dateTime": event_data.get("start_time"),
+                "timeZone": event_data.get("timezone", "UTC"),
+            },
+            "end": {
+                "dateTime": event_data.get("end_time"),
+                "timeZone": event_data.get("timezone", "UTC"),
+            },
+        }
+
+        # Add attendees if available
+        if "attendees" in event_data and event_data["attendees"]:
+            event["attendees"] = [{"email": email} for email in event_data["attendees"]]
+
+        # Add location if available
+        if "location" in event_data and event_data["location"]:
+            event["location"] = event_data["location"]
+
+        # Add conference details if needed
+        if event_data.get("add_conferencing", True):
+            event["conferenceData"] = {
+                "createRequest": {
+                    "requestId": f"interview-{secrets.token_hex(8)}",
+                    "conferenceSolutionKey": {"type": "hangoutsMeet"},
+                }
+            }
+
+        return event
+
     def get_available_slots(
         self, days_forward: int = 7, duration_minutes: int = 60
     ) -> List[Dict[str, str]]:
@@ -139,7 +307,7 @@ class GoogleCalendarScheduler:
                 return []
 
             # Use timezone-aware datetimes consistently
-            now = datetime.now().replace(tzinfo=pytz.UTC)
+            now = datetime.now().replace(tzinfo=timezone.utc)
             start_time = now.replace(hour=8, minute=0, second=0, microsecond=0)
             end_time = (now + timedelta(days=days_forward)).replace(
                 hour=18, minute=0, second=0, microsecond=0
@@ -156,65 +324,77 @@ class GoogleCalendarScheduler:
                 "items": [{"id": "primary"}],
             }
 
-            freebusy_response = self.service.freebusy().query(body=freebusy_query).execute()
+            freebusy_response = self._freebusy.query(body=freebusy_query).execute(num_retries=_NUM_RETRIES)
             busy_periods = freebusy_response.get("calendars", {}).get("primary", {}).get("busy", [])
 
-            # Generate all possible slots
-            all_slots = []
-            slot_duration = timedelta(minutes=duration_minutes)
-
-            # Look through each day
-            current_day = start_time
-            while current_day.date() <= end_time.date():
-                # Start at 8 AM, end at 6 PM for each day
-                day_start = datetime.combine(current_day.date(), datetime.min.time()).replace(
-                    hour=8, tzinfo=pytz.UTC
-                )
+            # Parse each busy period once into epoch-second arrays
+            busy_starts = np.fromiter(
+                (_parse_timestamp(busy["start"]) for busy in busy_periods),
+                dtype=np.float64,
+                count=len(busy_periods),
+            )
+            busy_ends = np.fromiter(
+                (_parse_timestamp(busy["end"]) for busy in busy_periods),
+                dtype=np.float64,
+                count=len(busy_periods),
+            )
+            busy_starts, busy_ends = _merge_intervals(busy_starts, busy_ends)
 
-                day_end = datetime.combine(current_day.date(), datetime.min.time()).replace(
-                    hour=18, tzinfo=pytz.UTC
+            # Work in integer microseconds so that today's first slot starts exactly at now
+            busy_starts, busy_ends = (
+                busy_starts * _MICROSECONDS_PER_SECOND,
+                busy_ends * _MICROSECONDS_PER_SECOND,
+            )
+            now_us = (now - _EPOCH) // timedelta(microseconds=1)
+
+            first_midnight = int(start_time.timestamp()) // _SECONDS_PER_DAY * _SECONDS_PER_DAY
+            n_days = (end_time.date() - start_time.date()).days + 1
+            day_midnights = (
+                first_midnight + _SECONDS_PER_DAY * np.arange(n_days, dtype=np.int64)
+            ) * _MICROSECONDS_PER_SECOND
+
+            # Each day's working window runs 8 AM to 6 PM, starting no earlier than now
+            window_starts = np.maximum(day_midnights + _WORKDAY_START * _MICROSECONDS_PER_SECOND, now_us)
+            window_ends = day_midnights + _WORKDAY_END * _MICROSECONDS_PER_SECOND
+
+            # Nothing can be free if every remaining working window lies inside one busy period
+            if busy_starts.size:
+                containing = np.maximum(np.searchsorted(busy_starts, window_starts, side="right") - 1, 0)
+                covered = (busy_starts[containing] <= window_starts) & (
+                    busy_ends[containing] >= window_ends
                 )
+                if (covered | (window_starts >= window_ends)).all():
+                    return []
+
+            # Generate all possible slots: 30-minute increments from each window's start
+            # for as long as a whole slot still fits before the window ends
+            duration_us = duration_minutes * 60 * _MICROSECONDS_PER_SECOND
+            step_us = _SLOT_STEP * _MICROSECONDS_PER_SECOND
+            counts = np.maximum((window_ends - duration_us - window_starts) // step_us + 1, 0)
+            if not counts.sum():
+                return []
 
-                # Skip if this day is already past
-                if day_end < now:
-                    current_day += timedelta(days=1)
-                    continue
-
-                # Adjust day_start if it's earlier than now
-                if day_start < now:
-                    day_start = now
-
-                # Create slots throughout the day
-                slot_start = day_start
-                while slot_start + slot_duration <= day_end:
-                    slot_end = slot_start + slot_duration
-
-                    # Check if this slot overlaps with any busy period
-                    is_free = True
-                    for busy in busy_periods:
-                        # Parse busy times with timezone info
-                        busy_start = datetime.fromisoformat(busy["start"].replace("Z", "+00:00"))
-                        busy_end = datetime.fromisoformat(busy["end"].replace("Z", "+00:00"))
-
-                        # Now both times have timezone info, so comparison works
-                        if not (slot_end <= busy_start or slot_start >= busy_end):
-                            is_free = False
-                            break
-
-                    # Add this slot if it's free
-                    if is_free:
-                        all_slots.append(
-                            {
-                                "start": slot_start.isoformat(),
-                                "end": slot_end.isoformat(),
-                            }
-                        )
-
-                    # Move to next slot
-                    slot_start += timedelta(minutes=30)  # 30-minute increments
-
-                # Move to next day
-                current_day += timedelta(days=1)
+            first_index = np.repeat(np.cumsum(counts) - counts, counts)
+            slot_starts = np.repeat(window_starts, counts) + step_us * (
+                np.arange(counts.sum(), dtype=np.int64) - first_index
+            )
+            slot_ends = slot_starts + duration_us
+
+            # Busy periods are now sorted and disjoint, so the first period that could overlap
+            # a slot is found with a binary search. A slot is busy if that period starts before
+            # the slot ends.
+            first = np.searchsorted(busy_ends, slot_starts, side="right")
+            free = np.ones(slot_starts.shape, dtype=bool)
+            candidates = first < busy_starts.size
+            free[candidates] = busy_starts[first[candidates]] >= slot_ends[candidates]
+
+            all_slots = [
+                {
+                    "start": (_EPOCH + timedelta(microseconds=int(start))).isoformat(),
+                    "end": (_EPOCH + timedelta(microseconds=int(end))).isoformat(),
+                }
+                for start, end in zip(slot_starts[free], slot_ends[free])
+            ]
 
             return all_slots
 
@@ -245,7 +425,7 @@ class GoogleCalendarScheduler:
             "items": [{"id": "primary"}],
         }
 
-        free_busy_request = self.service.freebusy().query(body=query).execute()
+        free_busy_request = self._freebusy.query(body=query).execute(num_retries=_NUM_RETRIES)
         busy_periods = free_busy_request.get("calendars", {}).get("primary", {}).get("busy", [])
 
         return busy_periods
@@ -1,19 +1,227 @@
 """Google Sheets storage module for interacting with Google Sheets API."""
 
 import os
+import time
+import atexit
+import random
+import itertools
 import logging
+import threading
+import weakref
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Optional
 import gspread
+import numpy as np
+from gspread.http_client import HTTPClient
+from requests import Response
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Appends insert new rows after the table rather than overwriting cells below it, so
+# concurrent writers can't clobber each other's rows
+_INSERT_ROWS = gspread.utils.InsertDataOption.insert_rows
+
+# Values are stored exactly as sent rather than parsed as if typed into the UI, which
+# is cheaper server-side and keeps message text from being evaluated as formulas
+_RAW = gspread.utils.ValueInputOption.raw
+
+# Messages worksheet layout
+_MESSAGE_HEADERS = (
+    "ID",
+    "Source",
+    "Sender Name",
+    "Sender Email",
+    "Timestamp",
+    "Subject",
+    "Preview",
+    "Intent",
+    "Processed",
+    "Link",
+)
+_MESSAGE_ROWS_RANGE = "A2:J"  # Every column, below the header
+_MAX_RANGES_PER_READ = 100  # Keeps batch_get query strings well under URL length limits
+_SOURCE_COLUMN = _MESSAGE_HEADERS.index("Source")
+_TIMESTAMP_COLUMN = _MESSAGE_HEADERS.index("Timestamp")
+_INTENT_COLUMN = _MESSAGE_HEADERS.index("Intent")
+
+# Characters of message content kept in the Preview column
+_PREVIEW_LENGTH = 100
+
+# Stats worksheet layout
+_STATS_HEADERS = (
+    "Date",
+    "Emails",
+    "LinkedIn",
+    "Handshake",
+    "Other",
+    "Total",
+    "Interview Requests",
+)
+_STATS_RANGE = "A:G"
+_TOTAL_COLUMN = _STATS_HEADERS.index("Total") + 1
+_INTERVIEWS_COLUMN = _STATS_HEADERS.index("Interview Requests") + 1
+
+# Interviews worksheet layout
+_INTERVIEW_HEADERS = (
+    "ID",
+    "Message ID",
+    "Candidate Name",
+    "Email",
+    "Scheduled Date",
+    "Status",
+    "Calendar Link",
+    "Notes",
+)
+
+# Required worksheets and their header rows
+_WORKSHEET_HEADERS = {
+    "Messages": _MESSAGE_HEADERS,
+    "Interviews": _INTERVIEW_HEADERS,
+    "Stats": _STATS_HEADERS,
+}
+
+# Stats column (1-based) counting messages from each source
+_SOURCE_COLUMNS = {
+    "gmail": 2,
+    "outlook": 2,  # Both count as emails
+    "linkedin": 3,
+    "handshake": 4,
+    "slack": 5,
+    "discord": 5,
+}
+_OTHER_COLUMN = 5
+
+# Number of buffered messages that triggers a write to the sheet
+_FLUSH_SIZE = 100
+
+# Sheets API requests allowed per minute per user, and retry policy for failed requests.
+# A 5xx can arrive after a write was applied, so only reads retry them; a 429 means the
+# request was rejected outright and is safe to resend for any method.
+_REQUESTS_PER_MINUTE = 60
+_RETRY_READ_STATUS_CODES = frozenset({429, 500, 503})
+_RETRY_WRITE_STATUS_CODES = frozenset({429})
+_MAX_ATTEMPTS = 6
+_BACKOFF_BASE = 0.5
+_MAX_BACKOFF = 30
+
+
+class _BackoffHTTPClient(HTTPClient):
+    """gspread HTTP client that paces requests to the API quota and retries throttled ones."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Initialize the client with a full token bucket."""
+        super().__init__(*args, **kwargs)
+        self._tokens = float(_REQUESTS_PER_MINUTE)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def request(self, *args: Any, **kwargs: Any) -> Response:
+        """
+        Send a request, retrying rate limit errors, and server errors on reads, with jittered
+        exponential backoff.
+
+        Returns:
+            The HTTP response
+
+        Raises:
+            gspread.exceptions.APIError: If the request fails with a non-retryable error or
+                every attempt fails
+        """
+        method = str(kwargs.get("method", args[0] if args else "")).lower()
+        retry_codes = _RETRY_READ_STATUS_CODES if method == "get" else _RETRY_WRITE_STATUS_CODES
+
+        attempt = 0
+        while True:
+            self._acquire()
+            try:
+                return super().request(*args, **kwargs)
+            except gspread.exceptions.APIError as e:
+                attempt += 1
+                if e.code not in retry_codes or attempt >= _MAX_ATTEMPTS:
+                    raise
+
+                delay = self._retry_after(e) or random.uniform(
+                    0, min(_MAX_BACKOFF, _BACKOFF_BASE * 2**attempt)
+                )
+                logger.warning("Sheets API returned %s, retrying in %.1fs", e.code, delay)
+                time.sleep(delay)
+
+    @staticmethod
+    def _retry_after(error: gspread.exceptions.APIError) -> Optional[float]:
+        """
+        Get the server-requested delay from a throttled response's Retry-After header.
+
+        Args:
+            error: The API error raised for the response
+
+        Returns:
+            Seconds to wait, capped at the maximum backoff, or None if no usable header was sent
+        """
+        retry_after = error.response.headers.get("Retry-After", "")
+        if not retry_after.isdigit():
+            return None
+        return min(float(retry_after), _MAX_BACKOFF)
+
+    def _acquire(self) -> None:
+        """Wait until the per-minute request quota allows another request."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                float(_REQUESTS_PER_MINUTE),
+                self._tokens + (now - self._last_refill) * _REQUESTS_PER_MINUTE / 60,
+            )
+            self._last_refill = now
+
+            if self._tokens < 1:
+                time.sleep((1 - self._tokens) * 60 / _REQUESTS_PER_MINUTE)
+                self._last_refill = time.monotonic()
+                self._tokens = 1.0
+
+            self._tokens -= 1
+
+
+# Storages whose buffered messages are written out when the process exits. Held weakly so
+# that registering for the exit flush doesn't keep every storage alive until then.
+_open_storages: "weakref.WeakSet[GoogleSheetsStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_open_storages() -> None:
+    """Write out the messages still buffered in every live storage."""
+    for storage in list(_open_storages):
+        storage.flush()
+
 
 class GoogleSheetsStorage:
     """Google Sheets storage class for interacting with Google Sheets API."""
 
-    def __init__(self) -> None:
-        """Initialize Google Sheets storage."""
+    def __init__(self, credentials_path: Optional[str] = None) -> None:
+        """
+        Initialize Google Sheets storage.
+
+        Args:
+            credentials_path: Optional path to a service account key file; defaults to
+                gspread's standard service account location
+        """
+        # Row number of each stored message ID, loaded from the sheet on first use
+        self._message_rows: Optional[Dict[str, int]] = None
+
+        # Today's Stats row, cached so each update only needs to write
+        self._stats_today: Optional[Dict[str, Any]] = None
+
+        # Worksheet handles by title, so each is only looked up once
+        self._worksheets: Dict[str, gspread.Worksheet] = {}
+
+        # Messages waiting to be written, keyed by ID, and their per-source counts
+        self._pending_messages: Dict[str, List[Any]] = {}
+        self._pending_sources: Counter = Counter()
+
+        # Interview IDs count up from the millisecond clock at startup, so two interviews
+        # stored within the same second still get distinct IDs
+        self._interview_seq = itertools.count(int(time.time() * 1000))
+
         try:
             # Get sheet ID from environment
             self.sheet_id = os.getenv("GOOGLE_SHEET_ID")
@@ -23,82 +231,115 @@ class GoogleSheetsStorage:
                 return
 
             # Initialize the client
-            self.client = gspread.service_account()
+            if credentials_path:
+                self.client = gspread.service_account(
+                    filename=credentials_path, http_client=_BackoffHTTPClient
+                )
+            else:
+                self.client = gspread.service_account(http_client=_BackoffHTTPClient)
             self.sheet = self.client.open_by_key(self.sheet_id)
 
             # Initialize worksheets if needed
             self._ensure_worksheets_exist()
 
-            logger.info(f"Google Sheets storage initialized with sheet ID: {self.sheet_id}")
+            # Write out any buffered messages when the process exits
+            _open_storages.add(self)
+
+            logger.info("Google Sheets storage initialized with sheet ID: %s", self.sheet_id)
         except Exception as e:
-            logger.error(f"Error initializing Google Sheets: {str(e)}", exc_info=True)
+            logger.error("Error initializing Google Sheets: %s", e, exc_info=True)
             self.sheet = None
 
     def _ensure_worksheets_exist(self) -> None:
         """Ensure that all required worksheets exist, create if not."""
-        required_worksheets = ["Messages", "Interviews", "Stats"]
-
         if self.sheet is None:
             logger.error("Cannot ensure worksheets exist: Google Sheet is not initialized")
             return
 
-        existing_worksheets = [ws.title for ws in self.sheet.worksheets()]
-
-        for worksheet_name in required_worksheets:
-            if worksheet_name not in existing_worksheets:
-                logger.info(f"Creating worksheet '{worksheet_name}'")
-                self.sheet.add_worksheet(title=worksheet_name, rows=1000, cols=10)
-
-                # Set up headers for new worksheets
-                worksheet = self.sheet.worksheet(worksheet_name)
-
-                if worksheet_name == "Messages":
-                    headers = [
-                        "ID",
-                        "Source",
-                        "Sender Name",
-                        "Sender Email",
-                        "Timestamp",
-                        "Subject",
-                        "Preview",
-                        "Intent",
-                        "Processed",
-                        "Link",
-                    ]
-                    worksheet.append_row(headers)
-
-                elif worksheet_name == "Interviews":
-                    headers = [
-                        "ID",
-                        "Message ID",
-                        "Candidate Name",
-                        "Email",
-                        "Scheduled Date",
-                        "Status",
-                        "Calendar Link",
-                        "Notes",
-                    ]
-                    worksheet.append_row(headers)
-
-                elif worksheet_name == "Stats":
-                    headers = [
-                        "Date",
-                        "Emails",
-                        "LinkedIn",
-                        "Handshake",
-                        "Other",
-                        "Total",
-                        "Interview Requests",
-                    ]
-                    worksheet.append_row(headers)
+        # One metadata fetch lists every worksheet; keep the handles for later use
+        for worksheet in self.sheet.worksheets():
+            self._worksheets[worksheet.title] = worksheet
+
+        missing = [name for name in _WORKSHEET_HEADERS if name not in self._worksheets]
+        if not missing:
+            return
+
+        logger.info("Creating worksheets: %s", ", ".join(missing))
+
+        # Add every missing worksheet in one request
+        response = self.sheet.batch_update(
+            {
+                "requests": [
+                    {
+                        "addSheet": {
+                            "properties": {
+                                "title": worksheet_name,
+                                "sheetType": "GRID",
+                                "gridProperties": {"rowCount": 1000, "columnCount": 10},
+                            }
+                        }
+                    }
+                    for worksheet_name in missing
+                ]
+            }
+        )
+        for reply in response["replies"]:
+            properties = reply["addSheet"]["properties"]
+            self._worksheets[properties["title"]] = gspread.Worksheet(
+                self.sheet, properties, self.sheet.id, self.sheet.client
+            )
+
+        # Set up headers for new worksheets in one request
+        self.sheet.values_batch_update(
+            {
+                "valueInputOption": _RAW,
+                "data": [
+                    {
+                        "range": gspread.utils.absolute_range_name(worksheet_name, "A1"),
+                        "values": [list(_WORKSHEET_HEADERS[worksheet_name])],
+                    }
+                    for worksheet_name in missing
+                ],
+            }
+        )
 
     def store_message(self, message: Dict[str, Any]) -> bool:
         """
         Store a message in the Google Sheet.
 
+        Messages are buffered and written in batches; call flush() to write them immediately.
+
         Args:
             message: The message data to store
 
+        Returns:
+            True if the message was buffered (or, when it filled the buffer, the batch was
+            written), False otherwise. True does not mean the message is in the sheet yet.
+        """
+        if self.sheet is None:
+            logger.error("Google Sheets not initialized")
+            return False
+
+        try:
+            self._queue_message(message)
+
+            if len(self._pending_messages) >= _FLUSH_SIZE:
+                return self.flush()
+
+            return True
+
+        except Exception as e:
+            logger.error("Error storing message in Google Sheets: %s", e, exc_info=True)
+            self._message_rows = None  # Reload from the sheet on next use
+            return False
+
+    def store_messages(self, messages: List[Dict[str, Any]]) -> bool:
+        """
+        Store several messages in the Google Sheet with a single append.
+
+        Args:
+            messages: The message data to store
+
         Returns:
             True if successful, False otherwise
         """
@@ -107,25 +348,41 @@ class GoogleSheetsStorage:
             return False
 
         try:
-            messages_sheet = self.sheet.worksheet("Messages")
+            for message in messages:
+                self._queue_message(message)
 
-            # Check if message already exists
-            existing_ids = messages_sheet.col_values(1)[1:]  # Skip header
-            if message["id"] in existing_ids:
-                logger.info(f"Message {message['id']} already exists, skipping")
-                return True
+        except Exception as e:
+            logger.error("Error storing messages in Google Sheets: %s", e, exc_info=True)
+            self._message_rows = None  # Reload from the sheet on next use
+            return False
 
-            # Format message data for sheet
-            content_preview = (
-                message["content"][:100] + "..." if len(message["content"]) > 100 else message["content"]
-            )
-            timestamp = message.get("timestamp", "")
+        return self.flush()
 
-            # Convert timestamp to readable format if it's a Unix timestamp
-            if isinstance(timestamp, (int, float)):
-                timestamp = datetime.fromtimestamp(int(timestamp) / 1000).strftime("%Y-%m-%d %H:%M:%S")
+    def _queue_message(self, message: Dict[str, Any]) -> None:
+        """
+        Buffer a message row for the next flush, skipping messages already stored.
 
-            row_data = [
+        Args:
+            message: The message data to store
+        """
+        messages_sheet = self._get_worksheet("Messages")
+
+        # Check if message already exists
+        message_rows = self._get_message_rows(messages_sheet)
+        message_id = str(message["id"])
+        if message_id in message_rows or message_id in self._pending_messages:
+            logger.info("Message %s already exists, skipping", message["id"])
+            return
+
+        # Format message data for sheet
+        content = message["content"]
+        content_preview = content if len(content) <= _PREVIEW_LENGTH else f"{content[:_PREVIEW_LENGTH]}..."
+        timestamp = message.get("timestamp", "")
+
+        # Cells are written as RAW text, so coerce every value to a string up front
+        row_data = [
+            str(value)
+            for value in (
                 message["id"],
                 message["source"],
                 message.get("sender_name", ""),
@@ -136,86 +393,196 @@ class GoogleSheetsStorage:
                 message.get("intent", "unknown"),
                 "false",  # Processed flag, initially false
                 "",  # Link placeholder
-            ]
+            )
+        ]
+
+        # Unix timestamps are converted to a readable format for the whole batch on flush
+        if isinstance(timestamp, (int, float)):
+            row_data[_TIMESTAMP_COLUMN] = timestamp
+
+        # Buffer the row until enough have accumulated
+        self._pending_messages[message_id] = row_data
+        self._pending_sources[message["source"]] += 1
+        logger.info("Queued message %s from %s", message["id"], message["source"])
+
+    def flush(self) -> bool:
+        """
+        Write buffered messages to the sheet in one request and update stats.
+
+        Returns:
+            True if successful (or nothing was buffered), False otherwise
+        """
+        if not self._pending_messages:
+            return True
+
+        if self.sheet is None:
+            logger.error("Google Sheets not initialized")
+            return False
+
+        try:
+            messages_sheet = self._get_worksheet("Messages")
+            message_rows = self._get_message_rows(messages_sheet)
+
+            rows = list(self._pending_messages.values())
+            self._format_timestamps(rows)
 
             # Add to sheet
-            messages_sheet.append_row(row_data)
+            response = messages_sheet.append_rows(
+                rows,
+                value_input_option=_RAW,
+                insert_data_option=_INSERT_ROWS,
+            )
+            first_row = self._appended_row(response, len(message_rows) + 2)
+            for offset, message_id in enumerate(self._pending_messages):
+                message_rows[message_id] = first_row + offset
+
+            source_counts = self._pending_sources
+            stored = len(self._pending_messages)
+            self._pending_messages = {}
+            self._pending_sources = Counter()
 
             # Update stats
-            self._update_stats(message["source"])
+            self._update_stats(source_counts)
 
-            logger.info(f"Stored message {message['id']} from {message['source']}")
+            logger.info("Stored %s messages", stored)
             return True
 
         except Exception as e:
-            logger.error(f"Error storing message in Google Sheets: {str(e)}", exc_info=True)
+            # Keep the buffer so the rows are retried on the next flush
+            logger.error("Error storing messages in Google Sheets: %s", e, exc_info=True)
+            self._message_rows = None  # Reload from the sheet on next use
             return False
 
-    def _update_stats(self, source: str) -> None:
+    def _format_timestamps(self, rows: List[List[Any]]) -> None:
         """
-        Update stats worksheet with new message count.
+        Convert Unix millisecond timestamps in message rows to readable local-time strings, in place.
 
         Args:
-            source: The source of the message (gmail, linkedin, etc.)
+            rows: Message rows, whose Timestamp cell may hold a number
         """
-        if self.sheet is None:
-            logger.error("Cannot update stats: Google Sheet is not initialized")
+        numeric = [row for row in rows if isinstance(row[_TIMESTAMP_COLUMN], (int, float))]
+        if not numeric:
             return
 
+        # numpy formats datetimes as UTC, so shift each one by the local UTC offset in effect
+        # at that moment (it changes with DST), then format the whole batch in one pass
+        millis = np.array([row[_TIMESTAMP_COLUMN] for row in numeric], dtype=np.int64)
+        offsets = np.array([time.localtime(ms // 1000).tm_gmtoff for ms in millis.tolist()], dtype=np.int64)
+        local_millis = millis + offsets * 1000
+        formatted = np.char.replace(
+            np.datetime_as_string(local_millis.astype("datetime64[ms]"), unit="s"), "T", " "
+        )
+        for row, timestamp in zip(numeric, formatted):
+            row[_TIMESTAMP_COLUMN] = str(timestamp)
+
+    def _get_message_rows(self, messages_sheet: gspread.Worksheet) -> Dict[str, int]:
+        """
+        Get the row number of every stored message, reading the ID column only once.
+
+        Args:
+            messages_sheet: The Messages worksheet
+
+        Returns:
+            Dictionary mapping message IDs to 1-based row numbers
+        """
+        if self._message_rows is None:
+            id_column = messages_sheet.col_values(1)[1:]  # Skip header
+            self._message_rows = {message_id: row for row, message_id in enumerate(id_column, start=2)}
+
+        return self._message_rows
+
+    def _appended_row(self, response: Any, default: int) -> int:
+        """
+        Get the row number written by an append request.
+
+        Args:
+            response: Response returned by the append request
+            default: Row number to use if the response doesn't say
+
+        Returns:
+            1-based row number of the appended row
+        """
         try:
-            stats_sheet = self.sheet.worksheet("Stats")
-            today = datetime.now().strftime("%Y-%m-%d")
+            updated_range = response["updates"]["updatedRange"]
+            return gspread.utils.a1_to_rowcol(updated_range.split("!")[-1].split(":")[0])[0]
+        except (KeyError, TypeError, IndexError, gspread.exceptions.IncorrectCellLabel):
+            return default
 
-            # Get today's row if it exists
-            date_column = stats_sheet.col_values(1)
-            row_index = None
+    def _update_stats(self, source_counts: Dict[str, int]) -> None:
+        """
+        Update stats worksheet with new message counts.
 
-            if today in date_column:
-                row_index = date_column.index(today) + 1
+        Args:
+            source_counts: Number of new messages from each source (gmail, linkedin, etc.)
+        """
+        if self.sheet is None:
+            logger.error("Cannot update stats: Google Sheet is not initialized")
+            return
 
+        try:
+            stats_sheet = self._get_worksheet("Stats")
+            stats_today = self._get_stats_today(stats_sheet)
+            values = stats_today["values"]
+
+            # Map each source to its column index and increment it, along with the total
+            columns = {_TOTAL_COLUMN}
+            for source, count in source_counts.items():
+                source_column = _SOURCE_COLUMNS.get(source, _OTHER_COLUMN)
+                values[source_column - 1] += count
+                columns.add(source_column)
+            values[_TOTAL_COLUMN - 1] += sum(source_counts.values())
+
+            row_index = stats_today["row_index"]
             if row_index:
-                # Update existing row
-                row_data = stats_sheet.row_values(row_index)
-
-                # Map source to column index
-                source_column = {
-                    "gmail": 2,
-                    "outlook": 2,  # Both count as emails
-                    "linkedin": 3,
-                    "handshake": 4,
-                    "slack": 5,
-                    "discord": 5,
-                }.get(
-                    source, 5
-                )  # Default to "Other" column
-
-                # Increment the appropriate column
-                if len(row_data) >= source_column:
-                    current_value = int(row_data[source_column - 1] or 0)
-                    stats_sheet.update_cell(row_index, source_column, current_value + 1)
-
-                # Update total
-                if len(row_data) >= 6:
-                    total = int(row_data[5] or 0)
-                    stats_sheet.update_cell(row_index, 6, total + 1)
+                # Update the changed columns of the existing row in a single request
+                updates = [
+                    {
+                        "range": gspread.utils.rowcol_to_a1(row_index, column),
+                        "values": [[values[column - 1]]],
+                    }
+                    for column in sorted(columns)
+                ]
+                stats_sheet.batch_update(updates, value_input_option=_RAW)
             else:
                 # Create new row for today
-                new_row = [today, 0, 0, 0, 0, 1, 0]  # Start with 1 total
+                response = stats_sheet.append_row(
+                    values, value_input_option=_RAW, insert_data_option=_INSERT_ROWS
+                )
+                stats_today["row_index"] = self._appended_row(response, 0) or None
+                if stats_today["row_index"] is None:
+                    self._stats_today = None  # Row unknown; find it from the sheet next time
 
-                # Set the source column
-                if source in ["gmail", "outlook"]:
-                    new_row[1] = 1  # Emails
-                elif source == "linkedin":
-                    new_row[2] = 1  # LinkedIn
-                elif source == "handshake":
-                    new_row[3] = 1  # Handshake
-                else:
-                    new_row[4] = 1  # Other
+        except Exception as e:
+            logger.error("Error updating stats: %s", e)
+            self._stats_today = None  # Re-read from the sheet on next use
 
-                stats_sheet.append_row(new_row)
+    def _get_stats_today(self, stats_sheet: gspread.Worksheet) -> Dict[str, Any]:
+        """
+        Get today's Stats row, reading the worksheet only on the first call each day.
 
-        except Exception as e:
-            logger.error(f"Error updating stats: {str(e)}")
+        Args:
+            stats_sheet: The Stats worksheet
+
+        Returns:
+            Dictionary with the date, the 1-based row_index (None if today has no row yet)
+            and the row values, with counters as ints
+        """
+        today = datetime.now().strftime("%Y-%m-%d")
+
+        if self._stats_today is None or self._stats_today["date"] != today:
+            row_index = None
+            values: List[Any] = [today] + [0] * (len(_STATS_HEADERS) - 1)
+
+            for index, row in enumerate(stats_sheet.batch_get([_STATS_RANGE])[0], start=1):
+                if row and row[0] == today:
+                    row_index = index
+                    for column, value in enumerate(row[1 : len(_STATS_HEADERS)], start=1):
+                        values[column] = int(value or 0)
+                    break
+
+            self._stats_today = {"date": today, "row_index": row_index, "values": values}
+
+        return self._stats_today
 
     def mark_as_processed(self, message_id: str, intent: Optional[str] = None) -> None:
         """
@@ -230,26 +597,37 @@ class GoogleSheetsStorage:
             return
 
         try:
-            messages_sheet = self.sheet.worksheet("Messages")
+            # Make sure a buffered message has been written before updating it
+            if message_id in self._pending_messages:
+                self.flush()
 
-            # Find message row
-            id_column = messages_sheet.col_values(1)
-            if message_id in id_column:
-                row_index = id_column.index(message_id) + 1
+            messages_sheet = self._get_worksheet("Messages")
 
+            # Find message row, re-reading the IDs in case another writer added it
+            row_index = self._get_message_rows(messages_sheet).get(message_id)
+            if row_index is None:
+                self._message_rows = None
+                row_index = self._get_message_rows(messages_sheet).get(message_id)
+
+            if row_index is not None:
                 # Update processed flag
-                messages_sheet.update_cell(row_index, 9, "true")
+                updates = [{"range": gspread.utils.rowcol_to_a1(row_index, 9), "values": [["true"]]}]
 
                 # Update intent if provided
                 if intent:
-                    messages_sheet.update_cell(row_index, 8, intent)
+                    updates.append(
+                        {"range": gspread.utils.rowcol_to_a1(row_index, 8), "values": [[intent]]}
+                    )
+
+                messages_sheet.batch_update(updates, value_input_option=_RAW)
 
-                logger.info(f"Marked message {message_id} as processed")
+                logger.info("Marked message %s as processed", message_id)
             else:
-                logger.warning(f"Message {message_id} not found in sheet")
+                logger.warning("Message %s not found in sheet", message_id)
 
         except Exception as e:
-            logger.error(f"Error marking message as processed: {str(e)}")
+            logger.error("Error marking message as processed: %s", e)
+            self._message_rows = None  # Reload from the sheet on next use
 
     def store_interview(self, interview_data: Dict[str, Any]) -> bool:
         """
@@ -266,43 +644,58 @@ class GoogleSheetsStorage:
             return False
 
         try:
-            interviews_sheet = self.sheet.worksheet("Interviews")
+            interviews_sheet = self._get_worksheet("Interviews")
 
             # Generate ID
-            interview_id = f"INT_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            interview_id = f"INT_{next(self._interview_seq)}"
 
+            # Cells are written as RAW text, so coerce every value to a string up front
             row_data = [
-                interview_id,
-                interview_data.get("message_id", ""),
-                interview_data.get("candidate_name", ""),
-                interview_data.get("email", ""),
-                interview_data.get("scheduled_date", ""),
-                interview_data.get("status", "scheduled"),
-                interview_data.get("calendar_link", ""),
-                interview_data.get("notes", ""),
+                str(value)
+                for value in (
+                    interview_id,
+                    interview_data.get("message_id", ""),
+                    interview_data.get("candidate_name", ""),
+                    interview_data.get("email", ""),
+                    interview_data.get("scheduled_date", ""),
+                    interview_data.get("status", "scheduled"),
+                    interview_data.get("calendar_link", ""),
+                    interview_data.get("notes", ""),
+                )
             ]
 
-            # Add to sheet
-            interviews_sheet.append_row(row_data)
-
-            # Update stats - increment interview requests
-            stats_sheet = self.sheet.worksheet("Stats")
-            today = datetime.now().strftime("%Y-%m-%d")
-            date_column = stats_sheet.col_values(1)
-
-            if today in date_column:
-                row_index = date_column.index(today) + 1
-                row_data = stats_sheet.row_values(row_index)
-
-                if len(row_data) >= 7:
-                    current_value = int(row_data[6] or 0)
-                    stats_sheet.update_cell(row_index, 7, current_value + 1)
-
-            logger.info(f"Stored interview {interview_id}")
+            # Add to sheet while today's stats row is read; the two requests are independent
+            stats_sheet = self._get_worksheet("Stats")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                appended = executor.submit(
+                    interviews_sheet.append_row,
+                    row_data,
+                    value_input_option=_RAW,
+                    insert_data_option=_INSERT_ROWS,
+                )
+                stats_today = self._get_stats_today(stats_sheet)
+                appended.result()
+
+            # Update stats - increment interview requests, only once the row is stored
+            row_index = stats_today["row_index"]
+            if row_index:
+                stats_today["values"][_INTERVIEWS_COLUMN - 1] += 1
+                stats_sheet.batch_update(
+                    [
+                        {
+                            "range": gspread.utils.rowcol_to_a1(row_index, _INTERVIEWS_COLUMN),
+                            "values": [[stats_today["values"][_INTERVIEWS_COLUMN - 1]]],
+                        }
+                    ],
+                    value_input_option=_RAW,
+                )
+
+            logger.info("Stored interview %s", interview_id)
             return True
 
         except Exception as e:
-            logger.error(f"Error storing interview: {str(e)}", exc_info=True)
+            logger.error("Error storing interview: %s", e, exc_info=True)
+            self._stats_today = None  # Re-read from the sheet on next use
             return False
 
     def get_messages(self, source: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -320,45 +713,123 @@ class GoogleSheetsStorage:
             return []
 
         try:
-            messages_sheet = self.sheet.worksheet("Messages")
-            all_records = messages_sheet.get_all_records()
-
-            # Transform sheet records to our standard message format
-            messages = []
-            for record in all_records:
-                message = {
-                    "id": record.get("ID", ""),
-                    "source": record.get("Source", ""),
-                    "sender_name": record.get("Sender Name", ""),
-                    "sender_email": record.get("Sender Email", ""),
-                    "timestamp": record.get("Timestamp", ""),
-                    "subject": record.get("Subject", ""),
-                    "content": record.get("Preview", ""),  # Use Preview field as content
-                    "intent": record.get("Intent", "unknown"),
-                    "processed": record.get("Processed", "false") == "true",
+            # Include messages still waiting in the buffer
+            self.flush()
+
+            return self._read_messages(_SOURCE_COLUMN, source)
+
+        except Exception as e:
+            logger.error("Error getting messages from Google Sheets: %s", e, exc_info=True)
+            return []
+
+    def _read_messages(self, column: int, value: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Read stored messages, optionally keeping only rows with a given column value.
+
+        Args:
+            column: 0-based index of the column to filter on
+            value: Value the column must equal, or None to keep every row
+
+        Returns:
+            List of message dictionaries
+        """
+        messages_sheet = self._get_worksheet("Messages")
+
+        # Read the raw values; trailing empty cells are omitted by the API
+        if value:
+            rows = self._read_matching_rows(messages_sheet, column, value)
+        else:
+            rows = messages_sheet.batch_get([_MESSAGE_ROWS_RANGE])[0]
+
+        # Transform sheet rows to our standard message format
+        messages = []
+        for row in rows:
+            row = row + [""] * (len(_MESSAGE_HEADERS) - len(row))
+
+            if value is not None and row[column] != value:
+                continue
+
+            messages.append(
+                {
+                    "id": row[0],
+                    "source": row[1],
+                    "sender_name": row[2],
+                    "sender_email": row[3],
+                    "timestamp": row[4],
+                    "subject": row[5],
+                    "content": row[6],  # Use Preview field as content
+                    "intent": row[7],
+                    "processed": row[8] == "true",
                 }
+            )
+
+        return messages
 
-                # Filter by source if specified
-                if source is None or message["source"] == source:
-                    messages.append(message)
+    def _read_matching_rows(
+        self, messages_sheet: gspread.Worksheet, column: int, value: str
+    ) -> List[List[str]]:
+        """
+        Read only the message rows whose column equals a value.
 
-            return messages
+        The filter column is downloaded on its own first, so the long Preview cells of
+        non-matching rows never cross the wire. Matching rows are then fetched in full,
+        with adjacent rows grouped into a single range. When the matches are too scattered
+        to fetch in one request, the whole sheet is read once instead.
 
-        except Exception as e:
-            logger.error(f"Error getting messages from Google Sheets: {str(e)}", exc_info=True)
+        Args:
+            messages_sheet: The Messages worksheet
+            column: 0-based index of the column to filter on
+            value: Value the column must equal
+
+        Returns:
+            Raw sheet rows of the matching messages, in sheet order
+        """
+        letter = chr(ord("A") + column)
+        cells = messages_sheet.batch_get([f"{letter}2:{letter}"])[0]
+
+        # Sheet row numbers of the matches; the projection starts at row 2
+        matches = [index + 2 for index, cell in enumerate(cells) if cell and cell[0] == value]
+        if not matches:
             return []
 
-    def _get_worksheet(self, worksheet_name: str):
+        # Collapse consecutive row numbers into A{first}:J{last} ranges
+        ranges = []
+        first = last = matches[0]
+        for row in matches[1:]:
+            if row != last + 1:
+                ranges.append(f"A{first}:J{last}")
+                first = row
+            last = row
+        ranges.append(f"A{first}:J{last}")
+
+        # One full read beats many requests for interleaved matches
+        if len(ranges) > _MAX_RANGES_PER_READ:
+            all_rows = messages_sheet.batch_get([_MESSAGE_ROWS_RANGE])[0]
+            return [all_rows[row - 2] for row in matches if row - 2 < len(all_rows)]
+
+        rows: List[List[str]] = []
+        for value_range in messages_sheet.batch_get(ranges):
+            rows.extend(value_range)
+
+        return rows
+
+    def _get_worksheet(self, worksheet_name: str) -> gspread.Worksheet:
         """Get worksheet by name, creating it if it doesn't exist."""
         if self.sheet is None:
             raise ValueError("Spreadsheet is not initialized")
 
+        worksheet = self._worksheets.get(worksheet_name)
+        if worksheet is not None:
+            return worksheet
+
         worksheets = self.sheet.worksheets()
         if worksheet_name not in [ws.title for ws in worksheets]:
-            logger.info(f"Creating worksheet '{worksheet_name}'")
+            logger.info("Creating worksheet '%s'", worksheet_name)
             self.sheet.add_worksheet(title=worksheet_name, rows=1000, cols=26)
 
-        return self.sheet.worksheet(worksheet_name)
+        worksheet = self.sheet.worksheet(worksheet_name)
+        self._worksheets[worksheet_name] = worksheet
+        return worksheet
 
     def get_documents(self, intent: str = "") -> List[Dict[str, Any]]:
         """
@@ -375,30 +846,11 @@ class GoogleSheetsStorage:
             return []
 
         try:
-            messages_sheet = self.sheet.worksheet("Messages")
-            all_records = messages_sheet.get_all_records()
-
-            # Transform sheet records to our standard message format
-            documents = []
-            for record in all_records:
-                document = {
-                    "id": record.get("ID", ""),
-                    "source": record.get("Source", ""),
-                    "sender_name": record.get("Sender Name", ""),
-                    "sender_email": record.get("Sender Email", ""),
-                    "timestamp": record.get("Timestamp", ""),
-                    "subject": record.get("Subject", ""),
-                    "content": record.get("Preview", ""),  # Use Preview field as content
-                    "intent": record.get("Intent", "unknown"),
-                    "processed": record.get("Processed", "false") == "true",
-                }
-
-                # Filter by intent if specified
-                if intent == "" or document["intent"] == intent:
-                    documents.append(document)
+            # Include messages still waiting in the buffer
+            self.flush()
 
-            return documents
+            return self._read_messages(_INTENT_COLUMN, intent or None)
 
         except Exception as e:
-            logger.error(f"Error getting documents from Google Sheets: {str(e)}", exc_info=True)
+            logger.error("Error getting documents from Google Sheets: %s", e, exc_info=True)
             return []
@@ -2,8 +2,8 @@
 
 import pytest
 from unittest.mock import MagicMock, patch
-import os
 import subprocess
+from selenium import webdriver
 from selenium.webdriver.common.by import By
 
 from src.automation.selenium_scripts.utils import (
@@ -20,17 +20,35 @@ from src.automation.selenium_scripts.utils import (
 class TestSeleniumUtils:
     """Tests for Selenium utility functions."""
 
-    @pytest.fixture
-    def mock_driver(self):
-        """Create a mock WebDriver for testing."""
-        driver = MagicMock()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def mock_driver(cls):
+        """Create a mock WebDriver shared by the tests in this class."""
+        driver = MagicMock(spec=webdriver.Chrome)
         return driver
 
-    @patch("src.automation.selenium_scripts.utils.webdriver.Chrome")
-    @patch("src.automation.selenium_scripts.utils.Service")
-    @patch("src.automation.selenium_scripts.utils.ChromeDriverManager")
-    def test_create_driver(self, mock_driver_manager, mock_service, mock_chrome, mock_driver):
+    @pytest.fixture(autouse=True)
+    def reset_driver(self, mock_driver):
+        """Clear calls recorded on the shared WebDriver after each test."""
+        yield
+        mock_driver.reset_mock()
+
+    @pytest.fixture(scope="class", autouse=True)
+    @classmethod
+    def selenium_patches(cls):
+        """Patch Chrome, its Service and ChromeDriverManager once for the whole class."""
+        with patch("src.automation.selenium_scripts.utils.webdriver.Chrome") as mock_chrome:
+            with patch("src.automation.selenium_scripts.utils.Service") as mock_service:
+                with patch("src.automation.selenium_scripts.utils.ChromeDriverManager") as mock_manager:
+                    cls._patches = (mock_chrome, mock_service, mock_manager)
+                    yield
+
+    def test_create_driver(self, mock_driver):
         """Test creating a Chrome WebDriver."""
+        mock_chrome, mock_service, mock_driver_manager = self._patches
+        for mock in self._patches:
+            mock.reset_mock()
+
         # Configure mocks
         mock_driver_manager.return_value.install.return_value = "/path/to/chromedriver"
         mock_service.return_value = "mocked_service"
@@ -98,12 +116,14 @@ class TestSeleniumUtils:
         mock_operation = MagicMock()
         mock_operation.side_effect = [ValueError("First attempt failed"), "success"]
 
-        # Test
-        result = retry_operation(mock_operation, max_retries=3, retry_delay=0)
+        # Test, with sleeping stubbed out so a change to the backoff can't slow the suite down
+        with patch("src.automation.selenium_scripts.utils.time.sleep") as mock_sleep:
+            result = retry_operation(mock_operation, max_retries=3, retry_delay=0)
 
         # Assertions
         assert result == "success"
         assert mock_operation.call_count == 2
+        mock_sleep.assert_called_once_with(0)
 
     def test_navigate_to_url(self, mock_driver):
         """Test navigating to a URL."""
@@ -140,31 +160,10 @@ class TestPuppeteerScripts:
         mock_process.returncode = 0
         mock_run.return_value = mock_process
 
-        # Test running the script
-        try:
-            # Path to the script
-            script_path = os.path.join(
-                os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-                "src",
-                "automation",
-                "puppeteer_scripts",
-                "handshake.js",
-            )
-
-            # Run the script
-            subprocess.run(
-                ["node", script_path],
-                capture_output=True,
-                text=True,
-                check=False,  # Don't raise exception on non-zero exit
-            )
-
-            # We can't actually test the script execution in a unit test
-            # This just verifies the mock is working
-            assert mock_run.called
-
-        except Exception as e:
-            # This test may fail in CI environments without Node.js
-            # Just log the error rather than failing the test
-            print(f"Error testing Puppeteer script: {str(e)}")
-            pass
+        # Run the script; the path is never touched because subprocess.run is mocked
+        script_path = "/fake/handshake.js"
+        result = subprocess.run(["node", script_path], capture_output=True, text=True, check=False)
+
+        # Assertions
+        mock_run.assert_called_once_with(["node", script_path], capture_output=True, text=True, check=False)
+        assert result.stdout == "[]"
@@ -4,7 +4,6 @@ import pytest
 import os
 import base64
 from unittest.mock import MagicMock, patch
-import inspect
 
 from src.connectors.email_connector import EmailConnector
 from src.connectors.linkedin_connector import LinkedInConnector
@@ -12,13 +11,89 @@ from src.connectors.handshake_connector import HandshakeConnector
 from src.connectors.slack_connector import SlackConnector
 from src.connectors.discord_connector import DiscordConnector
 
+# Credential-gated tests are skipped at collection time, so their connectors are never built
+requires_phantombuster = pytest.mark.skipif(
+    not os.environ.get("PHANTOMBUSTER_API_KEY"),
+    reason="PHANTOMBUSTER_API_KEY not set in environment variables",
+)
+requires_handshake = pytest.mark.skipif(
+    not os.environ.get("HANDSHAKE_USERNAME") or not os.environ.get("HANDSHAKE_PASSWORD"),
+    reason="Handshake credentials not set in environment variables",
+)
+requires_slack = pytest.mark.skipif(
+    not os.environ.get("SLACK_BOT_TOKEN"), reason="SLACK_BOT_TOKEN not set in environment variables"
+)
+requires_discord = pytest.mark.skipif(
+    not os.environ.get("DISCORD_BOT_TOKEN"), reason="DISCORD_BOT_TOKEN not set in environment variables"
+)
+
+
+# Gmail API responses used by test_fetch_messages, with message bodies encoded once at import
+_MSG1_B64 = base64.b64encode(b"Test Message").decode()
+_MSG2_B64 = base64.b64encode(b"Another Message").decode()
+
+_MESSAGE_LISTING = {"messages": [{"id": "msg1"}, {"id": "msg2"}]}
+
+_MSG1_CONTENT = {
+    "id": "msg1",
+    "internalDate": "1672574400000",
+    "payload": {
+        "headers": [
+            {"name": "From", "value": "Sender <sender@example.com>"},
+            {"name": "Subject", "value": "Test Subject"},
+            {"name": "Date", "value": "Mon, 1 Jan 2023 12:00:00 +0000"},
+        ],
+        "mimeType": "multipart/alternative",
+        "parts": [{"mimeType": "text/plain", "body": {"data": _MSG1_B64}}],
+    },
+}
+
+_MSG2_CONTENT = {
+    "id": "msg2",
+    "internalDate": "1672667600000",
+    "payload": {
+        "headers": [
+            {"name": "From", "value": "Another <another@example.com>"},
+            {"name": "Subject", "value": "Another Subject"},
+            {"name": "Date", "value": "Tue, 2 Jan 2023 14:00:00 +0000"},
+        ],
+        "mimeType": "text/plain",
+        "body": {"data": _MSG2_B64},
+    },
+}
+
+
+class _FakeExecutable:
+    """Stand-in for a Gmail API request that returns a fixed payload."""
+
+    def __init__(self, payload):
+        self._payload = payload
+
+    def execute(self):
+        return self._payload
+
+
+class _FakeMessages:
+    """Stand-in for the Gmail users().messages() resource, backed by plain dicts."""
+
+    def __init__(self, listing, by_id):
+        self._listing = listing
+        self._by_id = by_id
+
+    def list(self, **kwargs):
+        return _FakeExecutable(self._listing)
+
+    def get(self, userId, id, format=None):
+        return _FakeExecutable(self._by_id[id])
+
 
 class TestEmailConnector:
     """Tests for EmailConnector class."""
 
-    @pytest.fixture
-    def email_connector(self):
-        """Create an email connector for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def email_connector(cls):
+        """Create an email connector shared by the tests in this class."""
         # Add a patch for the entire EmailConnector._init_gmail method
         with patch.object(EmailConnector, "_init_gmail") as mock_init_gmail:
             # Make the method do nothing
@@ -31,8 +106,9 @@ class TestEmailConnector:
             connector.email_type = os.environ.get("EMAIL_TYPE", "gmail")
             connector.email_username = os.environ.get("EMAIL_USERNAME", "test@example.com")
 
-            # Create a mock service
-            connector.service = MagicMock()
+            # Create a mock service; Gmail resources are built dynamically, so the spec
+            # lists the one method the connector reaches through
+            connector.service = MagicMock(spec=["users"])
 
             # Set up the mock service to handle message fetching
             users_mock = MagicMock()
@@ -48,6 +124,12 @@ class TestEmailConnector:
 
             return connector
 
+    @pytest.fixture(autouse=True)
+    def reset_service(self, email_connector):
+        """Clear calls and responses recorded on the shared mock service after each test."""
+        yield
+        email_connector.service.reset_mock(return_value=True, side_effect=True)
+
     def test_initialization(self, email_connector):
         """Test initialization of email connector."""
         expected_email_type = os.environ.get("EMAIL_TYPE", "gmail")
@@ -58,60 +140,10 @@ class TestEmailConnector:
 
     def test_fetch_messages(self, email_connector):
         """Test fetching messages."""
-        # Add debugging
-        print("EmailConnector.fetch_messages signature:")
-        print(inspect.signature(email_connector.fetch_messages))
-
-        # Mock the Gmail API response
-        mock_messages_response = {"messages": [{"id": "msg1"}, {"id": "msg2"}]}
-
-        # Set up the execute method on the list mock
-        email_connector.service.users().messages().list().execute.return_value = mock_messages_response
-
-        # Mock the message content responses - add missing fields
-        msg1_content = {
-            "id": "msg1",
-            "internalDate": "1672574400000",
-            "payload": {
-                "headers": [
-                    {"name": "From", "value": "Sender <sender@example.com>"},
-                    {"name": "Subject", "value": "Test Subject"},
-                    {"name": "Date", "value": "Mon, 1 Jan 2023 12:00:00 +0000"},
-                ],
-                "mimeType": "multipart/alternative",
-                "parts": [
-                    {
-                        "mimeType": "text/plain",
-                        "body": {"data": base64.b64encode(b"Test Message").decode("utf-8")},
-                    }
-                ],
-            },
-        }
-
-        msg2_content = {
-            "id": "msg2",
-            "internalDate": "1672667600000",
-            "payload": {
-                "headers": [
-                    {"name": "From", "value": "Another <another@example.com>"},
-                    {"name": "Subject", "value": "Another Subject"},
-                    {"name": "Date", "value": "Tue, 2 Jan 2023 14:00:00 +0000"},
-                ],
-                "mimeType": "text/plain",
-                "body": {"data": base64.b64encode(b"Another Message").decode("utf-8")},
-            },
-        }
-
-        # Configure the mock to return different responses for different message IDs
-        def get_message_side_effect(userId, id, format=None):
-            mock_get_response = MagicMock()
-            if id == "msg1":
-                mock_get_response.execute.return_value = msg1_content
-            elif id == "msg2":
-                mock_get_response.execute.return_value = msg2_content
-            return mock_get_response
-
-        email_connector.service.users().messages().get.side_effect = get_message_side_effect
+        # Serve the listing and each message's content from plain dicts
+        email_connector.service.users.return_value.messages.return_value = _FakeMessages(
+            _MESSAGE_LISTING, {"msg1": _MSG1_CONTENT, "msg2": _MSG2_CONTENT}
+        )
 
         # Call the method without the days_back parameter
         messages = email_connector.fetch_messages()
@@ -128,127 +160,16 @@ class TestEmailConnector:
         assert messages[1]["subject"] == "Another Subject"
 
 
-# Additional test classes for other connectors
-class TestLinkedInConnector:
-    """Tests for LinkedInConnector class."""
-
-    @pytest.fixture
-    def linkedin_connector(self):
-        """Create a LinkedIn connector for testing."""
-        # Check if we have real credentials to use
-        os.environ.get("PHANTOMBUSTER_API_KEY", "")
-
-        connector = LinkedInConnector()
-        # Mock any external service calls
-        return connector
-
-    def test_initialization(self, linkedin_connector):
-        """Test initialization of LinkedIn connector."""
-        # Skip if no credentials
-        if not os.environ.get("PHANTOMBUSTER_API_KEY"):
-            pytest.skip("PHANTOMBUSTER_API_KEY not set in environment variables")
-
-        # Add initialization assertions here
-        pass
-
-    def test_fetch_messages(self, linkedin_connector):
-        """Test fetching LinkedIn messages."""
-        # Skip if no credentials
-        if not os.environ.get("PHANTOMBUSTER_API_KEY"):
-            pytest.skip("PHANTOMBUSTER_API_KEY not set in environment variables")
-
-        # Add test implementation here
-        pass
-
-
-class TestHandshakeConnector:
-    """Tests for HandshakeConnector class."""
-
-    @pytest.fixture
-    def handshake_connector(self):
-        """Create a Handshake connector for testing."""
-        connector = HandshakeConnector()
-        # Mock any external service calls
-        return connector
-
-    def test_initialization(self, handshake_connector):
-        """Test initialization of Handshake connector."""
-        # Skip if no credentials
-        if not os.environ.get("HANDSHAKE_USERNAME") or not os.environ.get("HANDSHAKE_PASSWORD"):
-            pytest.skip("Handshake credentials not set in environment variables")
-
-        # Add initialization assertions here
-        pass
-
-    def test_fetch_messages(self, handshake_connector):
-        """Test fetching Handshake messages."""
-        # Skip if no credentials
-        if not os.environ.get("HANDSHAKE_USERNAME") or not os.environ.get("HANDSHAKE_PASSWORD"):
-            pytest.skip("Handshake credentials not set in environment variables")
-
-        # Add test implementation here
-        pass
-
-
-class TestSlackConnector:
-    """Tests for SlackConnector class."""
-
-    @pytest.fixture
-    def slack_connector(self):
-        """Create a Slack connector for testing."""
-        # Check if we have real credentials to use
-        os.environ.get("SLACK_BOT_TOKEN", "")
-
-        connector = SlackConnector()
-        # Mock any external service calls
-        return connector
-
-    def test_initialization(self, slack_connector):
-        """Test initialization of Slack connector."""
-        # Skip if no credentials
-        if not os.environ.get("SLACK_BOT_TOKEN"):
-            pytest.skip("SLACK_BOT_TOKEN not set in environment variables")
-
-        # Add initialization assertions here
-        pass
-
-    def test_fetch_messages(self, slack_connector):
-        """Test fetching Slack messages."""
-        # Skip if no credentials
-        if not os.environ.get("SLACK_BOT_TOKEN"):
-            pytest.skip("SLACK_BOT_TOKEN not set in environment variables")
-
-        # Add test implementation here
-        pass
-
-
-class TestDiscordConnector:
-    """Tests for DiscordConnector class."""
-
-    @pytest.fixture
-    def discord_connector(self):
-        """Create a Discord connector for testing."""
-        # Check if we have real credentials to use
-        os.environ.get("DISCORD_BOT_TOKEN", "")
-
-        connector = DiscordConnector()
-        # Mock any external service calls
-        return connector
-
-    def test_initialization(self, discord_connector):
-        """Test initialization of Discord connector."""
-        # Skip if no credentials
-        if not os.environ.get("DISCORD_BOT_TOKEN"):
-            pytest.skip("DISCORD_BOT_TOKEN not set in environment variables")
-
-        # Add initialization assertions here
-        pass
-
-    def test_fetch_messages(self, discord_connector):
-        """Test fetching Discord messages."""
-        # Skip if no credentials
-        if not os.environ.get("DISCORD_BOT_TOKEN"):
-            pytest.skip("DISCORD_BOT_TOKEN not set in environment variables")
-
-        # Add test implementation here
-        pass
+# Connectors that need real credentials; each case is skipped at collection time without them
+@pytest.mark.parametrize(
+    "connector_class",
+    [
+        pytest.param(LinkedInConnector, marks=requires_phantombuster, id="linkedin"),
+        pytest.param(HandshakeConnector, marks=requires_handshake, id="handshake"),
+        pytest.param(SlackConnector, marks=requires_slack, id="slack"),
+        pytest.param(DiscordConnector, marks=requires_discord, id="discord"),
+    ],
+)
+def test_connector_initialization(connector_class):
+    """Test initialization of credential-gated connectors."""
+    assert connector_class() is not None
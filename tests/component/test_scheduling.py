@@ -1,29 +1,72 @@
 """Tests for scheduling modules."""
 
+import json
+import time
 import pytest
+import requests
 from unittest.mock import MagicMock, patch
-import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
+from freezegun import freeze_time
 
 from src.scheduling.calendly import CalendlyScheduler
-from src.scheduling.google_calendar import GoogleCalendarScheduler
+from src.scheduling.google_calendar import GoogleCalendarScheduler, OrjsonModel
+
+
+# Calendly API response with two scheduled events, serialized once at import
+_CALENDLY_EVENTS_JSON = json.dumps(
+    {
+        "data": [
+            {
+                "id": "event1",
+                "attributes": {
+                    "name": "Interview with Candidate",
+                    "start_time": "2023-01-15T10:00:00Z",
+                    "end_time": "2023-01-15T11:00:00Z",
+                    "status": "confirmed",
+                    "event_type": "interview",
+                    "location": {"location": "Zoom"},
+                    "cancellation_url": "https://calendly.com/cancel/event1",
+                },
+            },
+            {
+                "id": "event2",
+                "attributes": {
+                    "name": "Follow-up Meeting",
+                    "start_time": "2023-01-16T14:00:00Z",
+                    "end_time": "2023-01-16T15:00:00Z",
+                    "status": "confirmed",
+                    "event_type": "meeting",
+                    "location": {"location": "Google Meet"},
+                    "cancellation_url": "https://calendly.com/cancel/event2",
+                },
+            },
+        ]
+    }
+).encode()
+
+# Google Calendar freebusy response with two busy hours on 2023-01-20
+_FREEBUSY_RESPONSE = {
+    "calendars": {
+        "primary": {
+            "busy": [
+                {"start": "2023-01-20T09:00:00Z", "end": "2023-01-20T10:00:00Z"},
+                {"start": "2023-01-20T13:00:00Z", "end": "2023-01-20T14:00:00Z"},
+            ]
+        }
+    }
+}
 
 
 class TestCalendlyScheduler:
     """Tests for CalendlyScheduler class."""
 
     @pytest.fixture
-    def calendly_scheduler(self):
+    def calendly_scheduler(self, monkeypatch):
         """Create a Calendly scheduler for testing."""
-        with patch.dict(
-            os.environ,
-            {
-                "CALENDLY_API_KEY": "fake_api_key",
-                "CALENDLY_USER": "fake_user",
-                "CALENDLY_DEFAULT_LINK": "https://calendly.com/fake/interview",
-            },
-        ):
-            return CalendlyScheduler()
+        monkeypatch.setenv("CALENDLY_API_KEY", "fake_api_key")
+        monkeypatch.setenv("CALENDLY_USER", "fake_user")
+        monkeypatch.setenv("CALENDLY_DEFAULT_LINK", "https://calendly.com/fake/interview")
+        return CalendlyScheduler()
 
     def test_initialization(self, calendly_scheduler):
         """Test initialization of Calendly scheduler."""
@@ -35,40 +78,14 @@ class TestCalendlyScheduler:
         link = calendly_scheduler.get_scheduling_link()
         assert link == "https://calendly.com/fake/interview"
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_get_scheduled_events(self, mock_get, calendly_scheduler):
         """Test getting scheduled events."""
         # Mock the Calendly API response
-        mock_response = MagicMock()
+        mock_response = MagicMock(spec=requests.Response)
         mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "data": [
-                {
-                    "id": "event1",
-                    "attributes": {
-                        "name": "Interview with Candidate",
-                        "start_time": "2023-01-15T10:00:00Z",
-                        "end_time": "2023-01-15T11:00:00Z",
-                        "status": "confirmed",
-                        "event_type": "interview",
-                        "location": {"location": "Zoom"},
-                        "cancellation_url": "https://calendly.com/cancel/event1",
-                    },
-                },
-                {
-                    "id": "event2",
-                    "attributes": {
-                        "name": "Follow-up Meeting",
-                        "start_time": "2023-01-16T14:00:00Z",
-                        "end_time": "2023-01-16T15:00:00Z",
-                        "status": "confirmed",
-                        "event_type": "meeting",
-                        "location": {"location": "Google Meet"},
-                        "cancellation_url": "https://calendly.com/cancel/event2",
-                    },
-                },
-            ]
-        }
+        mock_response.headers = {}
+        mock_response.content = _CALENDLY_EVENTS_JSON
         mock_get.return_value = mock_response
 
         # Test
@@ -85,23 +102,153 @@ class TestCalendlyScheduler:
         assert events[1]["id"] == "event2"
         assert events[1]["name"] == "Follow-up Meeting"
 
+    @patch("requests.Session.get")
+    def test_get_scheduled_events_pagination(self, mock_get, calendly_scheduler):
+        """Test that every page of scheduled events is fetched."""
+        # Mock two pages of Calendly API responses
+        first_page = MagicMock()
+        first_page.status_code = 200
+        first_page.headers = {"ETag": '"v1"'}
+        first_page.content = json.dumps(
+            {
+                "data": [{"id": "event1", "attributes": {"name": "First"}}],
+                "pagination": {"next_page": "https://api.calendly.com/scheduled_events?page_token=abc"},
+            }
+        ).encode()
+        second_page = MagicMock()
+        second_page.status_code = 200
+        second_page.content = json.dumps(
+            {
+                "data": [{"id": "event2", "attributes": {"name": "Second"}}],
+                "pagination": {"next_page": None},
+            }
+        ).encode()
+        mock_get.side_effect = [first_page, second_page]
+
+        # Test
+        events = calendly_scheduler.get_scheduled_events()
+
+        # Assertions
+        assert [event["id"] for event in events] == ["event1", "event2"]
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0].kwargs["params"]["count"] == 100
+
+        # The first page's ETag doesn't cover later pages, so it isn't kept as a validator
+        assert len(calendly_scheduler._etags) == 0
+
+    @patch("requests.Session.get")
+    def test_get_scheduled_events_cached(self, mock_get, calendly_scheduler):
+        """Test that repeated queries are served from cache and revalidated with ETags."""
+        start_time = datetime(2023, 1, 15, 9, 0, 0)
+        end_time = datetime(2023, 1, 16, 9, 0, 0)
+
+        # Mock a response carrying an ETag, then an unchanged 304
+        first_response = MagicMock()
+        first_response.status_code = 200
+        first_response.headers = {"ETag": '"v1"'}
+        first_response.content = json.dumps({"data": [{"id": "event1", "attributes": {}}]}).encode()
+        not_modified = MagicMock()
+        not_modified.status_code = 304
+        mock_get.side_effect = [first_response, not_modified]
+
+        # Test: second call within the TTL never reaches the network
+        first = calendly_scheduler.get_scheduled_events(start_time, end_time)
+        second = calendly_scheduler.get_scheduled_events(start_time, end_time)
+        assert mock_get.call_count == 1
+        assert first == second
+
+        # Test: once expired, the cached ETag is revalidated
+        calendly_scheduler._events_cache.clear()
+        third = calendly_scheduler.get_scheduled_events(start_time, end_time)
+
+        # Assertions
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+        assert [event["id"] for event in third] == ["event1"]
+
+    @patch("requests.Session.get")
+    def test_get_scheduled_events_utc_params(self, mock_get, calendly_scheduler):
+        """Test that time range params are sent as UTC timestamps."""
+        mock_response = MagicMock(spec=requests.Response)
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'{"data": []}'
+        mock_get.return_value = mock_response
+
+        # Test with a timezone-aware start and a naive end with microseconds
+        start_time = datetime(2023, 1, 15, 11, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+        end_time = datetime(2023, 1, 16, 9, 0, 0, 500)
+        calendly_scheduler.get_scheduled_events(start_time, end_time)
+
+        # Assertions
+        params = mock_get.call_args.kwargs["params"]
+        assert params["min_start_time"] == "2023-01-15T09:00:00Z"
+        assert params["max_start_time"] == "2023-01-16T09:00:00Z"
+
+    @pytest.fixture
+    def utc_plus_two(self, monkeypatch):
+        """Run the test on a host whose local time is two hours ahead of UTC."""
+        monkeypatch.setenv("TZ", "EET-02")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    @patch("requests.Session.get")
+    def test_get_scheduled_events_default_range_utc(self, mock_get, calendly_scheduler, utc_plus_two):
+        """Test that the default time range starts at the current UTC time, not local time."""
+        mock_response = MagicMock(spec=requests.Response)
+        mock_response.status_code = 200
+        mock_response.headers = {}
+        mock_response.content = b'{"data": []}'
+        mock_get.return_value = mock_response
+
+        # Test
+        before = datetime.now(timezone.utc).replace(microsecond=0)
+        calendly_scheduler.get_scheduled_events()
+        after = datetime.now(timezone.utc)
+
+        # Assertions
+        params = mock_get.call_args.kwargs["params"]
+        start = datetime.strptime(params["min_start_time"], "%Y-%m-%dT%H:%M:%SZ").replace(
+            tzinfo=timezone.utc
+        )
+        end = datetime.strptime(params["max_start_time"], "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=timezone.utc)
+        assert before <= start <= after
+        assert end - start == timedelta(days=30)
+
 
 class TestGoogleCalendarScheduler:
     """Tests for GoogleCalendarScheduler class."""
 
-    @pytest.fixture
-    def google_calendar_scheduler(self):
-        """Create a Google Calendar scheduler for testing."""
+    @pytest.fixture(scope="class")
+    @classmethod
+    def google_calendar_scheduler(cls):
+        """Create a Google Calendar scheduler shared by the tests in this class."""
         with patch("src.scheduling.google_calendar.service_account.Credentials.from_service_account_file"):
             with patch("src.scheduling.google_calendar.build") as mock_build:
                 mock_service = MagicMock()
                 mock_build.return_value = mock_service
                 return GoogleCalendarScheduler()
 
+    @pytest.fixture(autouse=True)
+    def reset_service(self, google_calendar_scheduler):
+        """Clear calls recorded on the shared mock service after each test."""
+        yield
+        # Return values are kept: the scheduler holds on to service.events() and
+        # service.freebusy() from initialization, and every test sets the responses it reads
+        google_calendar_scheduler.service.reset_mock()
+
     def test_initialization(self, google_calendar_scheduler):
         """Test initialization of Google Calendar scheduler."""
         assert google_calendar_scheduler.service is not None
 
+    def test_orjson_model_deserialize(self):
+        """Test parsing Google API responses with orjson."""
+        assert OrjsonModel().deserialize(b'{"id": "event123"}') == {"id": "event123"}
+        assert OrjsonModel(data_wrapper=True).deserialize(b'{"data": {"id": "x"}}') == {"id": "x"}
+        assert OrjsonModel().deserialize(b"not json") == b"not json"
+
     def test_create_event(self, google_calendar_scheduler):
         """Test creating an event."""
         # Mock the Google Calendar API response
@@ -139,53 +286,98 @@ class TestGoogleCalendarScheduler:
         assert "body" in insert_call.call_args.kwargs
         assert insert_call.call_args.kwargs["body"]["summary"] == "Interview with Candidate"
 
-    def test_get_available_slots(self, google_calendar_scheduler):
-        """Test getting available time slots."""
-        # Mock the freebusy query response
-        mock_freebusy_response = {
-            "calendars": {
-                "primary": {
-                    "busy": [
-                        {
-                            "start": "2023-01-20T09:00:00Z",
-                            "end": "2023-01-20T10:00:00Z",
-                        },
-                        {
-                            "start": "2023-01-20T13:00:00Z",
-                            "end": "2023-01-20T14:00:00Z",
-                        },
-                    ]
-                }
-            }
-        }
-        google_calendar_scheduler.service.freebusy().query().execute.return_value = mock_freebusy_response
+    def test_create_events_bulk(self, google_calendar_scheduler):
+        """Test creating several events in one batch request."""
+        batch = MagicMock()
+        added = []
+        batch.add.side_effect = lambda request, request_id: added.append(request_id)
+        google_calendar_scheduler.service.new_batch_http_request.return_value = batch
+
+        # Simulate the batch running every callback, with the second insert failing
+        def execute_batch():
+            callback = google_calendar_scheduler.service.new_batch_http_request.call_args.kwargs["callback"]
+            callback(added[0], {"id": "event1"}, None)
+            callback(added[1], None, Exception("quota exceeded"))
+            callback(added[2], {"id": "event3"}, None)
+
+        batch.execute.side_effect = execute_batch
 
         # Test
-        with patch("src.scheduling.google_calendar.datetime") as mock_datetime:
-            # Mock current time to have a fixed starting point
-            fixed_now = datetime(2023, 1, 20, 8, 0, 0)
-            mock_datetime.now.return_value = fixed_now
-            mock_datetime.combine.return_value = fixed_now
-            mock_datetime.fromisoformat.side_effect = lambda x: datetime.fromisoformat(
-                x.replace("Z", "+00:00")
-            )
+        event_ids = google_calendar_scheduler.create_events_bulk(
+            [{"summary": f"Interview {i}", "add_conferencing": False} for i in range(3)]
+        )
 
-            # Propagate the real datetime methods to our mock
-            mock_datetime.side_effect = datetime
+        # Assertions
+        assert event_ids == ["event1", None, "event3"]
+        batch.execute.assert_called_once()
 
-            # Run the test
+    def test_get_available_slots(self, google_calendar_scheduler):
+        """Test getting available time slots."""
+        google_calendar_scheduler.service.freebusy().query().execute.return_value = _FREEBUSY_RESPONSE
+
+        # Test from a fixed starting point
+        with freeze_time("2023-01-20T08:00:00Z"):
             slots = google_calendar_scheduler.get_available_slots(days_forward=1, duration_minutes=30)
 
         # Assertions - Should have available slots that don't overlap with busy times
         assert len(slots) > 0
+        busy_ranges = [
+            (
+                datetime.fromisoformat(busy["start"].replace("Z", "+00:00")),
+                datetime.fromisoformat(busy["end"].replace("Z", "+00:00")),
+            )
+            for busy in _FREEBUSY_RESPONSE["calendars"]["primary"]["busy"]
+        ]
         for slot in slots:
             slot_start = datetime.fromisoformat(slot["start"].replace("Z", "+00:00"))
             slot_end = datetime.fromisoformat(slot["end"].replace("Z", "+00:00"))
 
-            # Check that the slot doesn't overlap with busy periods
-            for busy in mock_freebusy_response["calendars"]["primary"]["busy"]:
-                busy_start = datetime.fromisoformat(busy["start"].replace("Z", "+00:00"))
-                busy_end = datetime.fromisoformat(busy["end"].replace("Z", "+00:00"))
-
-                # No overlap condition: slot ends before busy starts or slot starts after busy ends
+            # No overlap condition: slot ends before busy starts or slot starts after busy ends
+            for busy_start, busy_end in busy_ranges:
                 assert slot_end <= busy_start or slot_start >= busy_end
+
+    def test_get_available_slots_start_from_now(self, google_calendar_scheduler):
+        """Test that today's slots start at the current time and step in 30-minute increments."""
+        google_calendar_scheduler.service.freebusy().query().execute.return_value = _FREEBUSY_RESPONSE
+
+        # Test from a time that isn't on a half-hour boundary
+        with freeze_time("2023-01-20T11:15:00Z"):
+            slots = google_calendar_scheduler.get_available_slots(days_forward=0, duration_minutes=60)
+
+        # Assertions - slots overlapping the 13:00-14:00 meeting are skipped, and the last
+        # slot is the latest one that still ends by 6 PM
+        expected = [
+            ("11:15", "12:15"),
+            ("11:45", "12:45"),
+            ("14:15", "15:15"),
+            ("14:45", "15:45"),
+            ("15:15", "16:15"),
+            ("15:45", "16:45"),
+            ("16:15", "17:15"),
+            ("16:45", "17:45"),
+        ]
+        assert slots == [
+            {"start": f"2023-01-20T{start}:00+00:00", "end": f"2023-01-20T{end}:00+00:00"}
+            for start, end in expected
+        ]
+
+    def test_get_available_slots_fully_booked(self, google_calendar_scheduler):
+        """Test that a calendar booked through working hours has no slots."""
+        google_calendar_scheduler.service.freebusy().query().execute.return_value = {
+            "calendars": {
+                "primary": {
+                    "busy": [
+                        {"start": "2023-01-21T07:00:00Z", "end": "2023-01-21T19:00:00Z"},
+                        {"start": "2023-01-20T08:00:00Z", "end": "2023-01-20T12:00:00Z"},
+                        {"start": "2023-01-20T12:00:00Z", "end": "2023-01-20T18:00:00Z"},
+                    ]
+                }
+            }
+        }
+
+        # Test
+        with freeze_time("2023-01-20T08:00:00Z"):
+            slots = google_calendar_scheduler.get_available_slots(days_forward=1, duration_minutes=30)
+
+        # Assertions
+        assert slots == []
@@ -1,129 +1,248 @@
 """Tests for storage modules."""
 
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, NonCallableMock, patch
 import os
+import time
+import gspread
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from gspread.http_client import HTTPClient
 
-from src.storage.google_sheets import GoogleSheetsStorage
+from src.storage.google_sheets import GoogleSheetsStorage, _BackoffHTTPClient, _flush_open_storages
+
+
+# Attribute lists for the spec'd mocks, read from the gspread classes once per module.
+# Spreadsheet.client is assigned in __init__, so it is added to the class's attributes.
+_SPREADSHEET_SPEC = (*dir(gspread.Spreadsheet), "client")
+_WORKSHEET_SPEC = tuple(dir(gspread.Worksheet))
+_HTTP_CLIENT_SPEC = tuple(dir(HTTPClient))
+
+
+def _mock_spreadsheet():
+    """
+    Build a stub-only mock spreadsheet holding the Messages, Interviews and Stats worksheets.
+
+    Returns:
+        Tuple of the spreadsheet mock and its worksheet mocks
+    """
+    mock_sheet = NonCallableMock(spec_set=_SPREADSHEET_SPEC)
+    mock_sheet.client = NonCallableMock(spec_set=_HTTP_CLIENT_SPEC)
+
+    # Mock existing worksheets to prevent initialization
+    mock_worksheets = []
+    for title in ("Messages", "Interviews", "Stats"):
+        mock_worksheet = NonCallableMock(spec_set=_WORKSHEET_SPEC)
+        mock_worksheet.title = title
+        mock_worksheets.append(mock_worksheet)
+    mock_sheet.worksheets.return_value = list(mock_worksheets)
+
+    # Configure the worksheet mock
+    mock_sheet.worksheet.side_effect = lambda name: next(
+        worksheet for worksheet in mock_worksheets if worksheet.title == name
+    )
+
+    # Mock col_values to return empty list (no existing messages)
+    mock_worksheets[0].col_values.return_value = ["ID"]  # Just the header
+
+    # Stats starts with only its header, so the first update of the day appends a new row
+    mock_worksheets[2].batch_get.return_value = [[["Date"]]]
+
+    return mock_sheet, mock_worksheets
+
+
+@dataclass(frozen=True)
+class _SampleMessage:
+    """Immutable message used as test data; store_message takes it via asdict()."""
+
+    __slots__ = (
+        "id",
+        "source",
+        "sender_name",
+        "sender_email",
+        "timestamp",
+        "subject",
+        "content",
+        "intent",
+    )
+
+    id: str
+    source: str
+    sender_name: str
+    sender_email: str
+    timestamp: str
+    subject: str
+    content: str
+    intent: str
+
+
+_SAMPLE_MESSAGE = _SampleMessage(
+    id="msg123",
+    source="email",
+    sender_name="Test Sender",
+    sender_email="sender@example.com",
+    timestamp="2023-01-10T12:00:00Z",
+    subject="Test Subject",
+    content="This is a test message.",
+    intent="interview_request",
+)
+
+# Messages sheet rows served by test_get_messages; the last row omits its trailing cells
+_SAMPLE_ROWS = (
+    (
+        "msg1",
+        "email",
+        "Person 1",
+        "person1@example.com",
+        "2023-01-05T10:00:00Z",
+        "Email Subject",
+        "Email content",
+        "information_request",
+        "false",
+    ),
+    (
+        "msg2",
+        "linkedin",
+        "Person 2",
+        "person2@example.com",
+        "2023-01-06T11:00:00Z",
+        "",
+        "LinkedIn message",
+        "interview_request",
+        "true",
+    ),
+    (
+        "msg3",
+        "email",
+        "Person 3",
+        "person3@example.com",
+        "2023-01-07T12:00:00Z",
+        "Another Email",
+        "Another email content",
+        "follow_up",
+    ),
+)
+
+
+class _FakeWorksheet:
+    """In-memory worksheet that records appended rows and serves A1-range reads from them."""
+
+    __slots__ = ("id", "title", "rows", "reads")
+
+    def __init__(self, title, rows=()):
+        self.id = 0
+        self.title = title
+        # Data rows only; the header occupies sheet row 1
+        self.rows = [list(row) for row in rows]
+        self.reads = []
+
+    def append_rows(self, rows, **kwargs):
+        first = len(self.rows) + 2
+        self.rows.extend(rows)
+        return {"updates": {"updatedRange": f"{self.title}!A{first}:J{len(self.rows) + 1}"}}
+
+    def col_values(self, col):
+        return ["ID"] + [row[col - 1] for row in self.rows]
+
+    def batch_get(self, ranges):
+        self.reads.append(list(ranges))
+        value_ranges = []
+        for cell_range in ranges:
+            start, end = cell_range.split(":")
+            first_col, last_col = ord(start[0]) - ord("A"), ord(end[0]) - ord("A")
+            first_row, last_row = int(start[1:]), int(end[1:] or len(self.rows) + 1)
+            value_ranges.append(
+                [row[first_col : last_col + 1] for row in self.rows[first_row - 2 : last_row - 1]]
+            )
+        return value_ranges
 
 
 class TestGoogleSheetsStorage:
     """Tests for GoogleSheetsStorage class."""
 
     @pytest.fixture
-    def google_sheets_storage(self):
-        """Create a Google Sheets storage for testing."""
+    def mock_spreadsheet(self):
+        """Build a fresh mocked spreadsheet and its worksheets for each test."""
+        return _mock_spreadsheet()
+
+    @pytest.fixture
+    def google_sheets_storage(self, mock_spreadsheet):
+        """Create a Google Sheets storage for testing, under mocked credentials."""
+        mock_sheet, mock_worksheets = mock_spreadsheet
+
         with patch("src.storage.google_sheets.gspread.service_account") as mock_service_account:
             with patch.dict(os.environ, {"GOOGLE_SHEET_ID": "fake_sheet_id"}):
-                # Mock the gspread client
-                mock_client = MagicMock()
-                mock_sheet = MagicMock()
-                mock_worksheet_messages = MagicMock()
-                mock_worksheet_stats = MagicMock()
-
-                # Mock existing worksheets to prevent initialization
-                mock_worksheets = [MagicMock(), MagicMock(), MagicMock()]
-                mock_worksheets[0].title = "Messages"
-                mock_worksheets[1].title = "Interviews"
-                mock_worksheets[2].title = "Stats"
-                mock_sheet.worksheets.return_value = mock_worksheets
-
-                # Configure the mocks
+                mock_client = NonCallableMock(spec_set=gspread.Client)
                 mock_service_account.return_value = mock_client
                 mock_client.open_by_key.return_value = mock_sheet
 
-                # Configure the worksheet mock
-                mock_sheet.worksheet.side_effect = lambda name: (
-                    mock_worksheet_messages if name == "Messages" else mock_worksheet_stats
-                )
-
-                # Mock col_values to return empty list (no existing messages)
-                mock_worksheet_messages.col_values.return_value = ["ID"]  # Just the header
-
-                # Create storage instance with our mocks
                 storage = GoogleSheetsStorage()
 
-                # Manually set the sheet property since the initialization is mocked
-                storage.sheet = mock_sheet
-
-                return storage
+        # Construction reads the worksheet list; start each test with clean call records
+        mock_sheet.reset_mock()
+        return storage
 
     def test_initialization(self, google_sheets_storage):
         """Test initialization of Google Sheets storage."""
         assert google_sheets_storage.sheet_id == "fake_sheet_id"
         assert google_sheets_storage.sheet is not None
 
+    def test_worksheet_handles_cached(self, google_sheets_storage):
+        """Test that worksheet metadata is fetched once per worksheet, not per call."""
+        sheet = google_sheets_storage.sheet
+        google_sheets_storage._worksheets.clear()  # Drop the handles found during construction
+
+        # Test
+        for i in range(100):
+            google_sheets_storage.store_message({"id": f"msg{i}", "source": "gmail", "content": "Hi"})
+        google_sheets_storage.get_messages(source="gmail")
+        google_sheets_storage.get_messages()
+
+        # Assertions - one lookup each for Messages and Stats
+        assert sheet.worksheets.call_count <= 2
+        assert sorted(call.args[0] for call in sheet.worksheet.call_args_list) == ["Messages", "Stats"]
+
     def test_store_message(self, google_sheets_storage):
         """Test storing a message."""
-        # Mock worksheet methods
-        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
-        messages_worksheet.col_values.return_value = ["ID"]  # Just the header
-
-        # Test data
-        message = {
-            "id": "msg123",
-            "source": "email",
-            "sender_name": "Test Sender",
-            "sender_email": "sender@example.com",
-            "timestamp": "2023-01-10T12:00:00Z",
-            "subject": "Test Subject",
-            "content": "This is a test message.",
-            "intent": "interview_request",
-        }
-
-        # Reset the append_row mock to clear any previous calls
-        messages_worksheet.append_row.reset_mock()
+        messages_worksheet = google_sheets_storage._worksheets["Messages"] = _FakeWorksheet("Messages")
 
         # Test
-        result = google_sheets_storage.store_message(message)
+        result = google_sheets_storage.store_message(asdict(_SAMPLE_MESSAGE))
+        assert messages_worksheet.rows == []
+        google_sheets_storage.flush()
 
         # Assertions
         assert result is True
-        messages_worksheet.append_row.assert_called_once()
+        assert len(messages_worksheet.rows) == 1
 
         # Check that the right data was sent
-        call_args = messages_worksheet.append_row.call_args[0][0]
-        assert call_args[0] == "msg123"  # ID
-        assert call_args[1] == "email"  # Source
-        assert call_args[2] == "Test Sender"  # Sender name
-        assert "interview_request" in call_args  # Intent
+        row = messages_worksheet.rows[0]
+        assert row[0] == _SAMPLE_MESSAGE.id  # ID
+        assert row[1] == _SAMPLE_MESSAGE.source  # Source
+        assert row[2] == _SAMPLE_MESSAGE.sender_name  # Sender name
+        assert _SAMPLE_MESSAGE.intent in row  # Intent
+
+    def test_store_messages_batch(self, google_sheets_storage):
+        """Test that a list of messages is written in a single append."""
+        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
+
+        # Test - fewer than the buffer size, so only store_messages' own flush writes them
+        messages = [{"id": f"msg{i}", "source": "gmail", "content": "Hi"} for i in range(50)]
+        result = google_sheets_storage.store_messages(messages)
+
+        # Assertions
+        assert result is True
+        messages_worksheet.append_rows.assert_called_once()
+        rows = messages_worksheet.append_rows.call_args[0][0]
+        assert [row[0] for row in rows] == [f"msg{i}" for i in range(50)]
+        assert google_sheets_storage._pending_messages == {}
 
     def test_get_messages(self, google_sheets_storage):
         """Test getting messages by source."""
-        # Mock the worksheet's get_all_records method
-        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
-        messages_worksheet.get_all_records.return_value = [
-            {
-                "ID": "msg1",
-                "Source": "email",
-                "Sender Name": "Person 1",
-                "Sender Email": "person1@example.com",
-                "Timestamp": "2023-01-05T10:00:00Z",
-                "Subject": "Email Subject",
-                "Content": "Email content",
-                "Intent": "information_request",
-            },
-            {
-                "ID": "msg2",
-                "Source": "linkedin",
-                "Sender Name": "Person 2",
-                "Sender Email": "person2@example.com",
-                "Timestamp": "2023-01-06T11:00:00Z",
-                "Subject": "",
-                "Content": "LinkedIn message",
-                "Intent": "interview_request",
-            },
-            {
-                "ID": "msg3",
-                "Source": "email",
-                "Sender Name": "Person 3",
-                "Sender Email": "person3@example.com",
-                "Timestamp": "2023-01-07T12:00:00Z",
-                "Subject": "Another Email",
-                "Content": "Another email content",
-                "Intent": "follow_up",
-            },
-        ]
+        # Serve the sheet's rows from an in-memory worksheet
+        messages_worksheet = google_sheets_storage._worksheets["Messages"] = _FakeWorksheet(
+            "Messages", _SAMPLE_ROWS
+        )
 
         # Test
         email_messages = google_sheets_storage.get_messages(source="email")
@@ -138,3 +257,291 @@ class TestGoogleSheetsStorage:
         assert email_messages[0]["id"] == "msg1"
         assert email_messages[1]["id"] == "msg3"
         assert linkedin_messages[0]["id"] == "msg2"
+        assert linkedin_messages[0]["processed"] is True
+        assert email_messages[1]["processed"] is False
+
+        # Filtered reads project the Source column, then fetch only the matching rows
+        assert messages_worksheet.reads[:2] == [["B2:B"], ["A2:J2", "A4:J4"]]
+
+    def test_get_messages_many_rows(self, google_sheets_storage):
+        """Test that filtering a large, interleaved sheet stays within two reads."""
+        rows = [
+            [
+                f"msg{i}",
+                "email" if i % 2 else "linkedin",
+                f"Person {i}",
+                "",
+                "",
+                "",
+                "Hi",
+                "unknown",
+                "false",
+            ]
+            for i in range(10_000)
+        ]
+        messages_worksheet = google_sheets_storage._worksheets["Messages"] = _FakeWorksheet(
+            "Messages", rows
+        )
+
+        # Test
+        email_messages = google_sheets_storage.get_messages(source="email")
+
+        # Assertions - 5,000 scattered matches are served by the projection and one full read
+        assert len(email_messages) == 5_000
+        assert email_messages[0]["id"] == "msg1"
+        assert email_messages[-1]["id"] == "msg9999"
+        assert all(message["source"] == "email" for message in email_messages)
+        assert messages_worksheet.reads == [["B2:B"], ["A2:J"]]
+
+    def test_update_stats_single_request(self, google_sheets_storage):
+        """Test that today's stats row is updated in one batch request."""
+        stats_worksheet = google_sheets_storage.sheet.worksheet("Stats")
+        today = datetime.now().strftime("%Y-%m-%d")
+        stats_worksheet.batch_get.return_value = [[["Date"], [today, "2", "0", "0", "0", "2", "0"]]]
+
+        # Test
+        google_sheets_storage._update_stats({"gmail": 1})
+        google_sheets_storage._update_stats({"linkedin": 2})
+
+        # Assertions - today's row is read once and each update is a single write
+        stats_worksheet.batch_get.assert_called_once()
+        stats_worksheet.update_cell.assert_not_called()
+        assert stats_worksheet.batch_update.call_args_list[0].args[0] == [
+            {"range": "B2", "values": [[3]]},
+            {"range": "F2", "values": [[3]]},
+        ]
+        assert stats_worksheet.batch_update.call_args_list[1].args[0] == [
+            {"range": "C2", "values": [[2]]},
+            {"range": "F2", "values": [[5]]},
+        ]
+
+    def test_message_ids_read_once(self, google_sheets_storage):
+        """Test that stored IDs are cached instead of re-reading the ID column."""
+        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
+        messages_worksheet.col_values.reset_mock()
+        messages_worksheet.col_values.return_value = ["ID", "msg1"]
+        messages_worksheet.append_rows.return_value = {"updates": {"updatedRange": "Messages!A3:J3"}}
+        google_sheets_storage._message_rows = None
+
+        # Test
+        message = {"id": "msg2", "source": "gmail", "content": "Hello"}
+        assert google_sheets_storage.store_message(message) is True
+        assert google_sheets_storage.store_message(message) is True
+        google_sheets_storage.mark_as_processed("msg2", intent="follow_up")
+
+        # Assertions
+        messages_worksheet.col_values.assert_called_once_with(1)
+        messages_worksheet.append_rows.assert_called_once()
+        updates = messages_worksheet.batch_update.call_args[0][0]
+        assert updates == [
+            {"range": "I3", "values": [["true"]]},
+            {"range": "H3", "values": [["follow_up"]]},
+        ]
+
+    def test_store_message_batches_rows(self, google_sheets_storage):
+        """Test that buffered messages are written in a single append."""
+        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
+        stats_worksheet = google_sheets_storage.sheet.worksheet("Stats")
+        messages_worksheet.append_rows.reset_mock()
+        stats_worksheet.batch_get.return_value = [[["Date"]]]
+
+        # Test
+        for i in range(100):
+            source = "gmail" if i % 2 else "linkedin"
+            google_sheets_storage.store_message({"id": f"msg{i}", "source": source, "content": "Hi"})
+
+        # Assertions - the 100th message triggers one write of every row
+        messages_worksheet.append_rows.assert_called_once()
+        assert len(messages_worksheet.append_rows.call_args[0][0]) == 100
+        google_sheets_storage.sheet.batch_update.assert_not_called()
+        new_row = stats_worksheet.append_row.call_args[0][0]
+        assert new_row[1:6] == [50, 50, 0, 0, 100]
+
+    def test_exit_flush_writes_buffered_messages(self, google_sheets_storage):
+        """Test that messages still buffered when the process exits are written."""
+        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
+        google_sheets_storage.store_message({"id": "msg1", "source": "gmail", "content": "Hi"})
+        messages_worksheet.append_rows.assert_not_called()
+
+        # Test
+        _flush_open_storages()
+
+        # Assertions
+        messages_worksheet.append_rows.assert_called_once()
+        assert google_sheets_storage._pending_messages == {}
+
+    def test_store_interview(self, google_sheets_storage):
+        """Test storing an interview and incrementing today's interview requests."""
+        interviews_worksheet = google_sheets_storage.sheet.worksheet("Interviews")
+        stats_worksheet = google_sheets_storage.sheet.worksheet("Stats")
+        today = datetime.now().strftime("%Y-%m-%d")
+        stats_worksheet.batch_get.return_value = [[["Date"], [today, "1", "0", "0", "0", "1", "2"]]]
+
+        # Test
+        result = google_sheets_storage.store_interview({"message_id": "msg1", "candidate_name": "Jane"})
+
+        # Assertions
+        assert result is True
+        row = interviews_worksheet.append_row.call_args[0][0]
+        assert row[1:3] == ["msg1", "Jane"]
+        stats_worksheet.batch_update.assert_called_once_with(
+            [{"range": "G2", "values": [[3]]}], value_input_option="RAW"
+        )
+
+    def test_store_interview_append_fails(self, google_sheets_storage):
+        """Test that a failed interview append leaves the stats unchanged."""
+        interviews_worksheet = google_sheets_storage.sheet.worksheet("Interviews")
+        stats_worksheet = google_sheets_storage.sheet.worksheet("Stats")
+        today = datetime.now().strftime("%Y-%m-%d")
+        stats_worksheet.batch_get.return_value = [[["Date"], [today, "1", "0", "0", "0", "1", "2"]]]
+        interviews_worksheet.append_row.side_effect = gspread.exceptions.GSpreadException("append failed")
+
+        # Test
+        result = google_sheets_storage.store_interview({"message_id": "msg1", "candidate_name": "Jane"})
+
+        # Assertions
+        assert result is False
+        stats_worksheet.batch_update.assert_not_called()
+
+    def test_store_interview_unique_ids(self, google_sheets_storage):
+        """Test that interviews stored back to back get distinct IDs."""
+        interviews_worksheet = google_sheets_storage.sheet.worksheet("Interviews")
+
+        # Test
+        google_sheets_storage.store_interview({"message_id": "msg1"})
+        google_sheets_storage.store_interview({"message_id": "msg2"})
+
+        # Assertions
+        first, second = (call.args[0][0] for call in interviews_worksheet.append_row.call_args_list)
+        assert first.startswith("INT_")
+        assert first != second
+
+    def test_mark_as_processed_rereads_ids(self, google_sheets_storage):
+        """Test that rows added by another writer are found by re-reading the ID column."""
+        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
+        messages_worksheet.col_values.reset_mock()
+        messages_worksheet.col_values.side_effect = [["ID", "msg1"], ["ID", "msg1", "msg2"]]
+        google_sheets_storage._message_rows = None
+
+        # Test
+        google_sheets_storage.mark_as_processed("msg2")
+
+        # Assertions
+        assert messages_worksheet.col_values.call_count == 2
+        messages_worksheet.batch_update.assert_called_once_with(
+            [{"range": "I3", "values": [["true"]]}], value_input_option="RAW"
+        )
+
+    def test_http_client_retries_rate_limit(self):
+        """Test that throttled Sheets API requests are retried with backoff."""
+        throttled = MagicMock()
+        throttled.json.return_value = {"error": {"code": 429, "message": "Quota exceeded", "status": ""}}
+        throttled.headers = {}
+        ok = MagicMock()
+
+        client = _BackoffHTTPClient(MagicMock(), session=MagicMock())
+        with patch("gspread.http_client.HTTPClient.request") as mock_request:
+            with patch("src.storage.google_sheets.time.sleep") as mock_sleep:
+                mock_request.side_effect = [gspread.exceptions.APIError(throttled), ok]
+
+                # Test
+                response = client.request("get", "https://sheets.googleapis.com/v4/spreadsheets/x")
+
+        # Assertions
+        assert response is ok
+        assert mock_request.call_count == 2
+        mock_sleep.assert_called_once()
+
+    def test_http_client_does_not_retry_failed_writes(self):
+        """Test that a server error on an append is raised rather than resent."""
+        unavailable = MagicMock()
+        unavailable.json.return_value = {"error": {"code": 503, "message": "Unavailable", "status": ""}}
+        unavailable.headers = {}
+
+        client = _BackoffHTTPClient(MagicMock(), session=MagicMock())
+        with patch("gspread.http_client.HTTPClient.request") as mock_request:
+            with patch("src.storage.google_sheets.time.sleep") as mock_sleep:
+                mock_request.side_effect = [gspread.exceptions.APIError(unavailable), MagicMock()]
+
+                # Test
+                with pytest.raises(gspread.exceptions.APIError):
+                    client.request(
+                        "post", "https://sheets.googleapis.com/v4/spreadsheets/x/values/Messages!A1:append"
+                    )
+
+        # Assertions - the write may already have been applied, so it is sent only once
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    def test_http_client_honors_retry_after(self):
+        """Test that a throttled request waits as long as the Retry-After header asks."""
+        throttled = MagicMock()
+        throttled.json.return_value = {"error": {"code": 429, "message": "Quota exceeded", "status": ""}}
+        throttled.headers = {"Retry-After": "7"}
+
+        client = _BackoffHTTPClient(MagicMock(), session=MagicMock())
+        with patch("gspread.http_client.HTTPClient.request") as mock_request:
+            with patch("src.storage.google_sheets.time.sleep") as mock_sleep:
+                mock_request.side_effect = [gspread.exceptions.APIError(throttled), MagicMock()]
+
+                # Test
+                client.request("get", "https://sheets.googleapis.com/v4/spreadsheets/x")
+
+        # Assertions
+        mock_sleep.assert_called_once_with(7.0)
+
+    def test_ensure_worksheets_exist_batches_creation(self, google_sheets_storage):
+        """Test that missing worksheets and their headers are created in one request each."""
+        sheet = google_sheets_storage.sheet
+        messages_worksheet = sheet.worksheet("Messages")
+        sheet.worksheets.return_value = [messages_worksheet]
+        sheet.batch_update.return_value = {
+            "replies": [
+                {"addSheet": {"properties": {"title": "Interviews", "sheetId": 1}}},
+                {"addSheet": {"properties": {"title": "Stats", "sheetId": 2}}},
+            ]
+        }
+        google_sheets_storage._worksheets = {}
+
+        # Test
+        with patch("src.storage.google_sheets.gspread.Worksheet") as mock_worksheet:
+            google_sheets_storage._ensure_worksheets_exist()
+
+        # Assertions
+        sheet.batch_update.assert_called_once()
+        added = [
+            request["addSheet"]["properties"]["title"]
+            for request in sheet.batch_update.call_args[0][0]["requests"]
+        ]
+        assert added == ["Interviews", "Stats"]
+        data = sheet.values_batch_update.call_args[0][0]["data"]
+        assert [entry["range"] for entry in data] == ["'Interviews'!A1", "'Stats'!A1"]
+        assert google_sheets_storage._worksheets["Stats"] is mock_worksheet.return_value
+
+    @pytest.fixture
+    def eastern_time(self, monkeypatch):
+        """Run the test in US Eastern time, five hours behind UTC in January."""
+        monkeypatch.setenv("TZ", "EST+05EDT,M3.2.0,M11.1.0")
+        time.tzset()
+        yield
+        monkeypatch.undo()
+        time.tzset()
+
+    def test_flush_formats_unix_timestamps(self, google_sheets_storage, eastern_time):
+        """Test that millisecond Unix timestamps are written as readable local times."""
+        messages_worksheet = google_sheets_storage.sheet.worksheet("Messages")
+
+        # Test
+        google_sheets_storage.store_message(
+            {"id": "msg1", "source": "slack", "content": "Hi", "timestamp": 1673352000123}
+        )
+        google_sheets_storage.store_message(
+            {"id": "msg2", "source": "gmail", "content": "Hi", "timestamp": "2023-01-10T12:00:00Z"}
+        )
+        google_sheets_storage.flush()
+
+        # Assertions
+        rows = messages_worksheet.append_rows.call_args[0][0]
+        assert rows[0][4] == datetime.fromtimestamp(1673352000).strftime("%Y-%m-%d %H:%M:%S")
+        assert rows[0][4] == "2023-01-10 07:00:00"
+        assert rows[1][4] == "2023-01-10T12:00:00Z"
@@ -1,76 +1,78 @@
 #!/usr/bin/env python3
 """Test script to verify email credentials are configured correctly."""
+import logging
 import os
+import re
 import imaplib
 import smtplib
 import sys
 import pytest
-from typing import Optional, List
-from tests.conftest import print_env_vars
+from typing import Dict, Optional, List, Tuple
 
+logger = logging.getLogger(__name__)
 
-def test_email_credentials() -> None:
-    """Test email credentials for IMAP and SMTP access."""
-    print("Testing Email credentials...")
+# IMAP host, SMTP host and SMTP port for each supported EMAIL_TYPE
+_EMAIL_SERVERS: Dict[str, Tuple[str, str, int]] = {
+    "gmail": ("imap.gmail.com", "smtp.gmail.com", 587),
+    "outlook": ("outlook.office365.com", "smtp.office365.com", 587),
+}
+
+# Message count in a STATUS (MESSAGES) response
+_MESSAGE_COUNT = re.compile(rb"MESSAGES (\d+)")
 
-    # Print environment variables to debug
-    print_env_vars()
+
+@pytest.mark.parametrize(
+    "email_type,imap_server_host,smtp_server_host,smtp_port_num",
+    [(email_type, *servers) for email_type, servers in _EMAIL_SERVERS.items()],
+)
+def test_email_credentials(
+    email_type: str, imap_server_host: str, smtp_server_host: str, smtp_port_num: int
+) -> None:
+    """Test email credentials for IMAP and SMTP access."""
+    logger.info("Testing Email credentials...")
 
     # Check environment variables
-    email_type: str = os.getenv("EMAIL_TYPE", "").lower()
+    configured_type: str = os.getenv("EMAIL_TYPE", "").lower()
     email_username: Optional[str] = os.getenv("EMAIL_USERNAME")
     email_password: Optional[str] = os.getenv("EMAIL_PASSWORD")
 
-    print(f"- Email type: {email_type if email_type else '✗ MISSING'}")
-    print(f"- Email username: {'✓ Found' if email_username else '✗ MISSING'}")
-    print(f"- Email password: {'✓ Found' if email_password else '✗ MISSING'}")
+    logger.info("- Email type: %s", configured_type if configured_type else "✗ MISSING")
+    logger.info("- Email username: %s", "✓ Found" if email_username else "✗ MISSING")
+    logger.info("- Email password: %s", "✓ Found" if email_password else "✗ MISSING")
 
-    if not all([email_type, email_username, email_password]):
-        print("❌ ERROR: Missing required email environment variables")
+    if not all([configured_type, email_username, email_password]):
+        logger.error("❌ ERROR: Missing required email environment variables")
         pytest.skip("Email credentials not found in environment variables")
 
-    # Set up connection details based on email type
-    imap_server_host: str = ""
-    smtp_server_host: str = ""
-    smtp_port_num: int = 0
-
-    if email_type == "gmail":
-        imap_server_host = "imap.gmail.com"
-        smtp_server_host = "smtp.gmail.com"
-        smtp_port_num = 587
-    elif email_type == "outlook":
-        imap_server_host = "outlook.office365.com"
-        smtp_server_host = "smtp.office365.com"
-        smtp_port_num = 587
-    else:
-        print(f"❌ ERROR: Unsupported email type '{email_type}'. Must be 'gmail' or 'outlook'")
-        pytest.skip("Unsupported email type")
+    # Only the configured provider's account can be checked
+    if configured_type != email_type:
+        pytest.skip(f"EMAIL_TYPE is not '{email_type}'")
 
     # Test IMAP connection
-    print(f"\nTesting IMAP connection to {imap_server_host}...")
+    logger.info("Testing IMAP connection to %s...", imap_server_host)
     try:
         mail: imaplib.IMAP4_SSL = imaplib.IMAP4_SSL(imap_server_host)
         if email_username is None or email_password is None:
             raise ValueError("Username or password is missing")
         mail.login(email_username, email_password)
-        print("✅ IMAP authentication successful!")
-        mail.select("INBOX")
-        messages: List[bytes]
-        status, messages = mail.search(None, "ALL")  # Correctly typed tuple unpacking
-        message_count: int = len(messages[0].split())
-        print(f"  Found {message_count} messages in inbox")
-        mail.close()
+        logger.info("✅ IMAP authentication successful!")
+        # STATUS returns just the count, where SEARCH ALL would list every message number
+        data: List[bytes]
+        status, data = mail.status("INBOX", "(MESSAGES)")
+        match: Optional[re.Match[bytes]] = _MESSAGE_COUNT.search(data[0])
+        message_count: int = int(match.group(1)) if match else 0
+        logger.info("  Found %s messages in inbox", message_count)
         mail.logout()
     except Exception as e:
-        print(f"❌ IMAP Error: {str(e)}")
-        print("\nTroubleshooting tips for Gmail:")
-        print("1. Make sure you've enabled IMAP in Gmail settings")
-        print("2. If using Gmail, you need an App Password if 2FA is enabled")
-        print("3. Check your credentials in the .env file")
+        logger.error("❌ IMAP Error: %s", e)
+        logger.info("Troubleshooting tips for Gmail:")
+        logger.info("1. Make sure you've enabled IMAP in Gmail settings")
+        logger.info("2. If using Gmail, you need an App Password if 2FA is enabled")
+        logger.info("3. Check your credentials in the .env file")
         pytest.fail("IMAP authentication failed")
 
     # Test SMTP connection
-    print(f"\nTesting SMTP connection to {smtp_server_host}:{smtp_port_num}...")
+    logger.info("Testing SMTP connection to %s:%s...", smtp_server_host, smtp_port_num)
     try:
         server: smtplib.SMTP = smtplib.SMTP(smtp_server_host, smtp_port_num)
         server.ehlo()
@@ -78,22 +80,27 @@ def test_email_credentials() -> None:
         if email_username is None or email_password is None:
             raise ValueError("Username or password is missing")
         server.login(email_username, email_password)
-        print("✅ SMTP authentication successful!")
+        logger.info("✅ SMTP authentication successful!")
         server.quit()
     except Exception as e:
-        print(f"❌ SMTP Error: {str(e)}")
-        print("\nTroubleshooting tips:")
-        print("1. Make sure you've allowed less secure apps or created an App Password")
-        print("2. Check your credentials in the .env file")
+        logger.error("❌ SMTP Error: %s", e)
+        logger.info("Troubleshooting tips:")
+        logger.info("1. Make sure you've allowed less secure apps or created an App Password")
+        logger.info("2. Check your credentials in the .env file")
         pytest.fail("SMTP authentication failed")
 
-    print("\n✅ SUCCESS: Email credentials are working correctly!")
+    logger.info("✅ SUCCESS: Email credentials are working correctly!")
 
 
 def run_test() -> bool:
     """Run the test and return boolean result for command line usage."""
     try:
-        test_email_credentials()
+        email_type: str = os.getenv("EMAIL_TYPE", "").lower()
+        if email_type not in _EMAIL_SERVERS:
+            logger.error("❌ ERROR: Unsupported email type '%s'. Must be 'gmail' or 'outlook'", email_type)
+            return False
+
+        test_email_credentials(email_type, *_EMAIL_SERVERS[email_type])
         return True
     except pytest.skip.Exception:
         return False
@@ -102,5 +109,6 @@ def run_test() -> bool:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     success = run_test()
     sys.exit(0 if success else 1)
@@ -1,35 +1,54 @@
 """Test OpenAI API credentials."""
+from __future__ import annotations
 
+import logging
 import os
-import openai
 import sys
 import pytest
-from openai import OpenAI
-from colorama import Fore, Style
+from typing import TYPE_CHECKING
 
+logger = logging.getLogger(__name__)
 
-def test_openai_credentials():
-    """Test OpenAI API key and connectivity."""
-    print("\n============================================================")
-    print("TESTING OPENAI CREDENTIALS")
-    print("============================================================")
+# openai is imported once an API key is found, so collecting this module without one stays cheap
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+
+def _build_client() -> OpenAI:
+    """Check for an OpenAI API key and build a client with it."""
+    logger.info("============================================================")
+    logger.info("TESTING OPENAI CREDENTIALS")
+    logger.info("============================================================")
 
     # Check if API key exists
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
-        print(f"- API Key: {Fore.RED}✗ Not found{Style.RESET_ALL}")
-        print(f"\n{Fore.RED}❌ ERROR: OpenAI API key not found in environment variables.{Style.RESET_ALL}")
-        print("Please add your OpenAI API key to the .env file as OPENAI_API_KEY.")
+        logger.info("- API Key: ✗ Not found")
+        logger.error("❌ ERROR: OpenAI API key not found in environment variables.")
+        logger.info("Please add your OpenAI API key to the .env file as OPENAI_API_KEY.")
         pytest.skip("OpenAI API key not found in environment variables")
 
-    print(f"- API Key: {Fore.GREEN}✓ Found{Style.RESET_ALL}")
+    logger.info("- API Key: ✓ Found")
+
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key)
+
+
+@pytest.fixture(scope="session")
+def openai_client() -> OpenAI:
+    """Build one OpenAI client, and its HTTP connection pool, for every test in the session."""
+    return _build_client()
+
+
+def test_openai_credentials(openai_client: OpenAI) -> None:
+    """Test OpenAI API key and connectivity."""
+    import openai
 
     # Test the API connection with a simple completion request
     try:
-        client = OpenAI(api_key=api_key)
-
-        print("\nTesting OpenAI API connection...")
-        response = client.chat.completions.create(
+        logger.info("Testing OpenAI API connection...")
+        response = openai_client.chat.completions.create(
             model="gpt-3.5-turbo",
             messages=[
                 {"role": "system", "content": "You are a helpful assistant."},
@@ -39,26 +58,26 @@ def test_openai_credentials():
         )
 
         # If we get here, the API call was successful
-        print(f"{Fore.GREEN}✅ OpenAI API connection successful!{Style.RESET_ALL}")
-        print(f"  Model: {response.model}")
-        print(f"  Response: {response.choices[0].message.content}")
+        logger.info("✅ OpenAI API connection successful!")
+        logger.info("  Model: %s", response.model)
+        logger.info("  Response: %s", response.choices[0].message.content)
 
     except openai.APIError as e:
-        print(f"{Fore.RED}❌ OpenAI API Error: {e}{Style.RESET_ALL}")
-        print("\nTroubleshooting tips:")
-        print("1. Verify your API key in the .env file")
-        print("2. Check if your OpenAI account has sufficient credit")
-        print("3. Make sure you're using a valid model name")
+        logger.error("❌ OpenAI API Error: %s", e)
+        logger.info("Troubleshooting tips:")
+        logger.info("1. Verify your API key in the .env file")
+        logger.info("2. Check if your OpenAI account has sufficient credit")
+        logger.info("3. Make sure you're using a valid model name")
         pytest.fail(f"OpenAI API Error: {e}")
     except Exception as e:
-        print(f"{Fore.RED}❌ Error connecting to OpenAI API: {e}{Style.RESET_ALL}")
+        logger.error("❌ Error connecting to OpenAI API: %s", e)
         pytest.fail(f"Error connecting to OpenAI API: {e}")
 
 
 def run_test() -> bool:
     """Run the test and return boolean result for command line usage."""
     try:
-        test_openai_credentials()
+        test_openai_credentials(_build_client())
         return True
     except pytest.skip.Exception:
         return False
@@ -67,5 +86,6 @@ def run_test() -> bool:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     success = run_test()
     sys.exit(0 if success else 1)
@@ -1,73 +1,100 @@
 #!/usr/bin/env python3
 """Test script to verify PhantomBuster API credentials."""
+import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
 import pytest
 import sys
+from typing import Iterator
 
+logger = logging.getLogger(__name__)
+
+
+PHANTOMBUSTER_API_URL = "https://api.phantombuster.com/api/v1"
 
-def test_phantombuster_credentials():
-    """Test PhantomBuster API key and agent ID."""
-    print("Testing PhantomBuster credentials...")
+
+def _build_session() -> requests.Session:
+    """Check for PhantomBuster credentials and build an authenticated API session."""
+    logger.info("Testing PhantomBuster credentials...")
 
     # Check environment variables
     api_key = os.getenv("PHANTOMBUSTER_API_KEY")
     agent_id = os.getenv("PHANTOMBUSTER_MESSAGE_AGENT_ID")
 
-    print(f"- API Key: {'✓ Found' if api_key else '✗ MISSING'}")
-    print(f"- Agent ID: {'✓ Found' if agent_id else '✗ MISSING'}")
+    logger.info("- API Key: %s", "✓ Found" if api_key else "✗ MISSING")
+    logger.info("- Agent ID: %s", "✓ Found" if agent_id else "✗ MISSING")
 
     if not api_key:
-        print("❌ ERROR: PhantomBuster API key missing")
+        logger.error("❌ ERROR: PhantomBuster API key missing")
         pytest.skip("PhantomBuster API key not found in environment variables")
 
+    # Keep-alive reuses one TLS connection across the account and agent requests
+    session = requests.Session()
+    session.headers.update({"X-Phantombuster-Key": api_key, "Content-Type": "application/json"})
+    session.mount(PHANTOMBUSTER_API_URL, HTTPAdapter(pool_connections=1, pool_maxsize=4))
+    return session
+
+
+@pytest.fixture(scope="session")
+def phantombuster_session() -> Iterator[requests.Session]:
+    """Build one PhantomBuster API session for every test in the session."""
+    session = _build_session()
+    yield session
+    session.close()
+
+
+def test_phantombuster_credentials(phantombuster_session: requests.Session):
+    """Test PhantomBuster API key and agent ID."""
+    agent_id = os.getenv("PHANTOMBUSTER_MESSAGE_AGENT_ID")
+
     # Test API key with a simple request
-    print("\nTesting API key with a request to the PhantomBuster API...")
-    headers = {"X-Phantombuster-Key": api_key, "Content-Type": "application/json"}
+    logger.info("Testing API key with a request to the PhantomBuster API...")
 
     try:
         # Get account info as a simple validation
-        response = requests.get("https://api.phantombuster.com/api/v1/user", headers=headers)
+        response = phantombuster_session.get(f"{PHANTOMBUSTER_API_URL}/user")
 
         if response.status_code == 200:
             data = response.json()
-            print(f"✅ API key is valid! Account email: {data.get('email', 'unknown')}")
+            logger.info("✅ API key is valid! Account email: %s", data.get("email", "unknown"))
         else:
-            print(f"❌ API request failed with status code {response.status_code}")
-            print(f"Response: {response.text}")
+            logger.error("❌ API request failed with status code %s", response.status_code)
+            logger.info("Response: %s", response.text)
             pytest.fail(f"API request failed with status code {response.status_code}")
 
         # If agent ID is provided, check if it exists
         if agent_id:
-            print(f"\nChecking agent with ID {agent_id}...")
-            response = requests.get(
-                f"https://api.phantombuster.com/api/v1/agent/{agent_id}",
-                headers=headers,
-            )
+            logger.info("Checking agent with ID %s...", agent_id)
+            response = phantombuster_session.get(f"{PHANTOMBUSTER_API_URL}/agent/{agent_id}")
 
             if response.status_code == 200:
                 agent_data = response.json()
-                print(f"✅ Agent exists! Name: {agent_data.get('name', 'unknown')}")
+                logger.info("✅ Agent exists! Name: %s", agent_data.get("name", "unknown"))
             else:
-                print(f"❌ Agent check failed with status code {response.status_code}")
-                print(f"Response: {response.text}")
+                logger.error("❌ Agent check failed with status code %s", response.status_code)
+                logger.info("Response: %s", response.text)
                 pytest.fail(f"Agent check failed with status code {response.status_code}")
 
-        print("\n✅ SUCCESS: PhantomBuster credentials are working correctly!")
+        logger.info("✅ SUCCESS: PhantomBuster credentials are working correctly!")
 
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
-        print("\nTroubleshooting tips:")
-        print("1. Verify your API key in the .env file")
-        print("2. Check your internet connection")
-        print("3. Make sure your PhantomBuster account is active")
+        logger.error("❌ Error: %s", e)
+        logger.info("Troubleshooting tips:")
+        logger.info("1. Verify your API key in the .env file")
+        logger.info("2. Check your internet connection")
+        logger.info("3. Make sure your PhantomBuster account is active")
         pytest.fail(f"Test failed with exception: {str(e)}")
 
 
 def run_test() -> bool:
     """Run the test and return boolean result for command line usage."""
     try:
-        test_phantombuster_credentials()
+        session = _build_session()
+        try:
+            test_phantombuster_credentials(session)
+        finally:
+            session.close()
         return True
     except pytest.skip.Exception:
         return False
@@ -76,5 +103,6 @@ def run_test() -> bool:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     success = run_test()
     sys.exit(0 if success else 1)
@@ -1,78 +1,124 @@
 #!/usr/bin/env python3
 """Test script to verify Slack API credentials."""
+from __future__ import annotations
+
+import logging
 import os
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
 import sys
 import pytest
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 
+logger = logging.getLogger(__name__)
 
-def test_slack_credentials() -> None:
-    """Test Slack Bot Token."""
-    print("Testing Slack credentials...")
+# slack_sdk is imported once a token is found, so collecting this module without one stays cheap
+if TYPE_CHECKING:
+    from slack_sdk import WebClient
+
+# Channels listed by the check
+_CHANNELS_SHOWN = 5
+
+
+def _build_client() -> WebClient:
+    """Check for a Slack bot token and build a client with it."""
+    logger.info("Testing Slack credentials...")
 
     # Check environment variables
     bot_token: Optional[str] = os.getenv("SLACK_BOT_TOKEN")
 
-    print(f"- Bot Token: {'✓ Found' if bot_token else '✗ MISSING'}")
+    logger.info("- Bot Token: %s", "✓ Found" if bot_token else "✗ MISSING")
 
     if not bot_token:
-        print("❌ ERROR: Slack Bot token missing")
+        logger.error("❌ ERROR: Slack Bot token missing")
         pytest.skip("Slack Bot token not found in environment variables")
 
+    from slack_sdk import WebClient
+
+    return WebClient(token=bot_token)
+
+
+@pytest.fixture(scope="session")
+def slack_client() -> WebClient:
+    """Build one Slack client for every test in the session."""
+    return _build_client()
+
+
+def _fetch_state(client: WebClient) -> Dict[str, Any]:
+    """
+    Verify the token and read the first page of public channels.
+
+    Args:
+        client: Slack client built from the bot token
+
+    Returns:
+        Dictionary with the auth.test response under "auth" and the channels under "channels"
+    """
+    from slack_sdk.errors import SlackApiError
+
     # Test token with a simple request
-    print("\nTesting connection to Slack API...")
-    client: WebClient = WebClient(token=bot_token)
+    logger.info("Testing connection to Slack API...")
 
     try:
         # Test auth to verify token
-        response: Dict[str, Any] = client.auth_test()
-
-        if response["ok"]:
-            print("✅ Authentication successful!")
-            print(f"  - Bot Name: {response.get('user', 'unknown')}")
-            print(f"  - Team: {response.get('team', 'unknown')}")
-
-            # Test listing channels
-            channels_response: Dict[str, Any] = client.conversations_list(types="public_channel")
-            channels: List[Dict[str, Any]] = channels_response.get("channels", [])
-
-            if channels:
-                print(f"\nFound {len(channels)} channels. First few:")
-                for i, channel in enumerate(channels[:5]):
-                    print(f"  - #{channel.get('name', 'unknown')}")
-                    if i >= 4:
-                        break
-            else:
-                print("\nNo channels found, or bot doesn't have permission to list channels.")
-
-            print("\n✅ SUCCESS: Slack credentials are working correctly!")
-        else:
-            print(f"❌ Authentication failed: {response.get('error', 'Unknown error')}")
-            pytest.fail(f"Authentication failed: {response.get('error', 'Unknown error')}")
+        auth: Dict[str, Any] = client.auth_test().data
+
+        # Only the first few channels are printed, so don't page through the rest
+        channels_response: Dict[str, Any] = client.conversations_list(
+            types="public_channel", limit=_CHANNELS_SHOWN
+        )
+        channels: List[Dict[str, Any]] = channels_response.get("channels", [])
+
+        return {"auth": auth, "channels": channels}
 
     except SlackApiError as e:
-        print(f"❌ Slack API Error: {e.response['error']}")
-        print("\nTroubleshooting tips:")
-        print("1. Verify your bot token in the .env file")
-        print("2. Make sure your Slack app has the necessary scopes:")
-        print("   - channels:read")
-        print("   - chat:write")
-        print("   - im:read")
-        print("   - im:write")
-        print("3. Check that your bot has been added to your workspace")
+        logger.error("❌ Slack API Error: %s", e.response["error"])
+        logger.info("Troubleshooting tips:")
+        logger.info("1. Verify your bot token in the .env file")
+        logger.info("2. Make sure your Slack app has the necessary scopes:")
+        logger.info("   - channels:read")
+        logger.info("   - chat:write")
+        logger.info("   - im:read")
+        logger.info("   - im:write")
+        logger.info("3. Check that your bot has been added to your workspace")
         pytest.fail(f"Slack API Error: {e.response['error']}")
 
     except Exception as e:
-        print(f"❌ Error: {str(e)}")
+        logger.error("❌ Error: %s", e)
         pytest.fail(f"Test failed with exception: {str(e)}")
 
 
+@pytest.fixture(scope="session")
+def slack_state(slack_client: WebClient) -> Dict[str, Any]:
+    """Call auth.test and conversations.list once for every test in the session."""
+    return _fetch_state(slack_client)
+
+
+def test_slack_credentials(slack_state: Dict[str, Any]) -> None:
+    """Test Slack Bot Token."""
+    auth: Dict[str, Any] = slack_state["auth"]
+
+    if not auth["ok"]:
+        logger.error("❌ Authentication failed: %s", auth.get("error", "Unknown error"))
+        pytest.fail(f"Authentication failed: {auth.get('error', 'Unknown error')}")
+
+    logger.info("✅ Authentication successful!")
+    logger.info("  - Bot Name: %s", auth.get("user", "unknown"))
+    logger.info("  - Team: %s", auth.get("team", "unknown"))
+
+    channels: List[Dict[str, Any]] = slack_state["channels"]
+    if channels:
+        logger.info("First few channels:")
+        for channel in channels:
+            logger.info("  - #%s", channel.get("name", "unknown"))
+    else:
+        logger.info("No channels found, or bot doesn't have permission to list channels.")
+
+    logger.info("✅ SUCCESS: Slack credentials are working correctly!")
+
+
 def run_test() -> bool:
     """Run the test and return boolean result for command line usage."""
     try:
-        test_slack_credentials()
+        test_slack_credentials(_fetch_state(_build_client()))
         return True
     except pytest.skip.Exception:
         return False
@@ -81,5 +127,6 @@ def run_test() -> bool:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     success = run_test()
     sys.exit(0 if success else 1)